@@ -1,127 +1,335 @@
 import json
+import mmap
+import os
 import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+from operator import itemgetter
+
+import numpy as np
+
+# orjson is optional; fall back to the standard library json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional; without it transcript_raw.json is loaded in one piece
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Numba is optional; without it the segment averages use NumPy's reduceat
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# RE2 is optional; its DFA-based matcher scans large raw_result strings in
+# linear time. The tokenizer only uses syntax that re and re2 share.
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Single-pass tokenizer over raw_result: FacePrediction times, the start of an
+# emotions list, individual EmotionScore entries and closing brackets
+_TOKEN_PATTERN = (
+    r"FacePrediction\(frame=\d+,\s*time=([-+0-9.eE]+)"
+    r"|EmotionScore\(name=['\"]([^'\"]+)['\"],\s*score=([-+0-9.eE]+)\)"
+    r"|(emotions=\[)"
+    r"|\]"
+)
+_regex = re2 if RE2_AVAILABLE else re
+_TOKEN_RE = _regex.compile(_TOKEN_PATTERN)
+# Same tokenizer for scanning the memory-mapped file bytes directly
+_TOKEN_RE_BYTES = _regex.compile(_TOKEN_PATTERN.encode("ascii"))
 
 def load_json(filename):
+    if ORJSON_AVAILABLE:
+        with open(filename, "rb") as f:
+            return orjson.loads(f.read())
     with open(filename, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def extract_emotion_frames_from_raw(raw):
+def iter_segments(filename):
+    """
+    Yields the transcript segments of transcript_raw.json one at a time.
+    With ijson the file is parsed incrementally, so only one segment (and its
+    word list) is held in memory at once.
+    """
+    if IJSON_AVAILABLE:
+        with open(filename, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        yield from load_json(filename)
+
+def _scores_to_array(score_strs):
+    """
+    Converts the captured score strings (str or bytes) to a float64 array in
+    one C-level pass. Scores may be written in exponent form (1e-05). Invalid
+    scores become 0.0 in a per-entry fallback.
+    """
+    try:
+        return np.array(score_strs, dtype=np.float64)
+    except ValueError:
+        scores = np.zeros(len(score_strs), dtype=np.float64)
+        for i, score_str in enumerate(score_strs):
+            try:
+                scores[i] = float(score_str)
+            except ValueError:
+                pass
+        return scores
+
+def _no_frames():
     """
-    Extracts face prediction frames from the raw_result string.
+    Returns the empty (times, names, cols, scores, offsets) frame structure.
+    """
+    return (np.empty(0, dtype=np.float64), [], np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.float64), np.zeros(1, dtype=np.int64))
+
+def _frames_from_tokens(tokens, decode_names=False):
+    """
+    Groups tokenizer matches into face prediction frames.
     Each frame is expected to include a 'time' value and a list of EmotionScore entries.
     
     For example, a segment might look like:
     FacePrediction(frame=0, time=0.0, ..., emotions=[EmotionScore(name='Admiration', score=0.09346), ...])
     
-    This function returns a list of dictionaries with keys:
-      - "time": a float (in seconds)
-      - "emotions": a list of dictionaries with keys "name" and "score"
+    This function returns a (times, names, cols, scores, offsets) tuple where:
+      - times is a float64 array of F frame times (in seconds)
+      - names lists every distinct emotion name once, in first-seen order
+      - cols (int32 indexes into names) and scores (float64) hold the emotion
+        entries of all frames back to back
+      - offsets is an int64 array of F + 1 entries; the emotions of frame i
+        are the entries offsets[i]:offsets[i + 1]
+    No per-entry objects are kept: the entries accumulate in flat typed arrays.
     """
-    # Improved pattern to capture FacePrediction blocks with time and emotions
-    pattern = r"FacePrediction\(frame=\d+,\s*time=([0-9.]+).*?emotions=\[(.*?)\]"
-    matches = re.findall(pattern, raw, re.DOTALL)
-    
-    frames = []
-    for time_str, emotions_str in matches:
-        try:
-            time_val = float(time_str)
-        except ValueError:
-            continue
-
-        # Pattern to capture individual emotion entries
-        emotion_pattern = r"EmotionScore\(name=['\"]([^'\"]+)['\"],\s*score=([0-9.]+)"
-        emotion_matches = re.findall(emotion_pattern, emotions_str)
-        
-        emotions = []
-        for name, score_str in emotion_matches:
+    times = array("d")
+    cols = array("i")
+    score_strs = []
+    offsets = array("q", [0])
+    # Each distinct name is stored once; entries refer to it by column index
+    name_to_col = {}
+    append_col = cols.append
+    append_score = score_strs.append
+    current_time = None
+    in_list = False
+    for m in tokens:
+        time_str, name, score_str, list_start = m.groups()
+        if time_str is not None:
+            if in_list:
+                # Drop the entries of a frame whose list was never closed
+                del cols[offsets[-1]:], score_strs[offsets[-1]:]
             try:
-                score_val = float(score_str)
+                current_time = float(time_str)
             except ValueError:
-                score_val = 0.0
-            emotions.append({"name": name, "score": score_val})
-        
-        if emotions:  # Only add frames that have emotion data
-            frames.append({"time": time_val, "emotions": emotions})
+                current_time = None
+            in_list = False
+        elif current_time is None:
+            continue
+        elif list_start is not None:
+            in_list = True
+        elif not in_list:
+            continue
+        elif name is not None:
+            col = name_to_col.get(name)
+            if col is None:
+                col = name_to_col[name] = len(name_to_col)
+            append_col(col)
+            append_score(score_str)
+        else:
+            # Closing bracket of the emotions list ends the frame
+            if len(cols) > offsets[-1]:  # Only add frames that have emotion data
+                times.append(current_time)
+                offsets.append(len(cols))
+            current_time = None
+            in_list = False
+    if in_list:
+        del cols[offsets[-1]:], score_strs[offsets[-1]:]
     
-    print(f"Extracted {len(frames)} frames with emotion data")
-    return frames
+    # Only the distinct names need decoding, not every entry
+    names = [name.decode("utf-8") if decode_names else name for name in name_to_col]
+    print(f"Extracted {len(times)} frames with emotion data")
+    return (np.frombuffer(times, dtype=np.float64), names, np.frombuffer(cols, dtype=np.int32),
+            _scores_to_array(score_strs), np.frombuffer(offsets, dtype=np.int64))
 
-def extract_emotion_frames(hume_data):
+def extract_emotion_frames_from_raw(raw):
     """
-    Extract emotion frames from the Hume analysis data.
-    The data is expected to be in a nested structure with a 'raw_result' field
-    that contains a string representation of Python objects.
+    Extracts face prediction frames from an in-memory raw_result string.
+    See _frames_from_tokens() for the returned structure.
     """
-    # First check if the raw_result is directly in hume_data
-    raw = hume_data.get("raw_result", "")
-    
-    # If not, check if it's nested under 'result'
-    if not raw and "result" in hume_data:
-        raw = hume_data.get("result", {}).get("raw_result", "")
-    
-    if not raw:
-        print("No raw_result field found in Hume data.")
-        return []
-    
-    frames = extract_emotion_frames_from_raw(raw)
-    return frames
-
-def average_emotions_for_segment(frames, start_time, end_time):
-    # Filter frames that fall within the provided time window
-    selected = [frame for frame in frames if start_time <= frame.get("time", 0) <= end_time]
-    if not selected:
-        return {}
+    # A plain substring check is far cheaper than a full regex scan that finds nothing
+    if "FacePrediction(" not in raw:
+        print("No FacePrediction entries found in raw_result.")
+        return _no_frames()
+    return _frames_from_tokens(_TOKEN_RE.finditer(raw))
+
+def extract_emotion_frames_from_file(filename):
+    """
+    Extract emotion frames from a Hume analysis file without loading it as JSON.
+    The raw_result field holds a string representation of Python objects, and
+    nothing else in the file matches the FacePrediction/EmotionScore tokens, so
+    the file is memory-mapped and scanned as bytes. This skips both the JSON
+    parse and the decode of the multi-megabyte raw_result string.
+    """
+    with open(filename, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            print("No FacePrediction entries found in raw_result.")
+            return _no_frames()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b"FacePrediction(") == -1:
+                print("No FacePrediction entries found in raw_result.")
+                return _no_frames()
+            return _frames_from_tokens(_TOKEN_RE_BYTES.finditer(mm), decode_names=True)
+
+def build_frame_arrays(frames):
+    """
+    Converts the extracted frames into column arrays:
+      - times: float64 array of shape (F,) with the frame times, sorted ascending
+      - scores: float64 array of shape (F, E), one column per emotion
+      - names: list of the E emotion names, in the order Hume reports them
+    Emotions missing from a frame are stored as 0.0.
+    """
+    frame_times, names, entry_cols, entry_scores, offsets = frames
+    times = np.array(frame_times, dtype=np.float64)
+    rows = np.repeat(np.arange(len(times)), np.diff(offsets))
+    cols = entry_cols.astype(np.intp)
+    # Names seen only in dropped (unclosed) frames get no column
+    used = np.bincount(cols, minlength=len(names)) > 0
+    if not used.all():
+        cols = (np.cumsum(used) - 1)[cols]
+        names = [name for name, keep in zip(names, used) if keep]
+    scores = np.zeros((len(times), len(names)), dtype=np.float64)
+    scores[rows, cols] = entry_scores
+    # Frames come out of raw_result in time order, but segment lookups rely on it
+    if len(times) > 1 and (np.diff(times) < 0).any():
+        order = np.argsort(times, kind="stable")
+        times, scores = times[order], scores[order]
+    return times, scores, names
+
+def _window_sums_numpy(scores, lo, hi):
+    """
+    Sums the score rows of every [lo, hi) frame window with one reduceat call.
+    """
+    # Interleave lo/hi so that every even reduceat entry sums one window; the
+    # zero row keeps hi == F a valid index
+    padded = np.vstack([scores, np.zeros((1, scores.shape[1]), dtype=scores.dtype)])
+    bounds = np.empty(2 * len(lo), dtype=np.intp)
+    bounds[0::2] = lo
+    bounds[1::2] = hi
+    return np.add.reduceat(padded, bounds, axis=0)[0::2]
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _window_sums_numba(scores, lo, hi):
+        """
+        Sums the score rows of every [lo, hi) frame window, one window per thread.
+        """
+        sums = np.zeros((lo.shape[0], scores.shape[1]), dtype=scores.dtype)
+        for s in prange(lo.shape[0]):
+            for f in range(lo[s], hi[s]):
+                for e in range(scores.shape[1]):
+                    sums[s, e] += scores[f, e]
+        return sums
+
+def average_emotions_for_segments(times, scores, names, starts, ends):
+    """
+    Computes the average emotion scores for every [start, end] window at once.
+    Returns one dictionary per window, empty when no frame falls inside it.
+    """
+    # Binary search the sorted frame times for every window
+    lo = np.searchsorted(times, starts, "left")
+    hi = np.searchsorted(times, ends, "right")
+    counts = hi - lo
+    if not len(counts) or not (counts > 0).any():
+        return [{} for _ in range(len(counts))]
     
-    emotion_totals = {}
-    count = 0
-    for frame in selected:
-        for emotion in frame.get("emotions", []):
-            name = emotion.get("name")
-            score = emotion.get("score", 0)
-            emotion_totals[name] = emotion_totals.get(name, 0) + score
-        count += 1
+    if NUMBA_AVAILABLE:
+        sums = _window_sums_numba(scores, lo, hi)
+    else:
+        sums = _window_sums_numpy(scores, lo, hi)
     
-    avg_emotions = {name: total / count for name, total in emotion_totals.items()}
-    return avg_emotions
+    nonempty = counts > 0
+    avgs = np.zeros_like(sums)
+    avgs[nonempty] = sums[nonempty] / counts[nonempty, None]
+    return [dict(zip(names, avg)) if n > 0 else {} for avg, n in zip(avgs.tolist(), counts.tolist())]
 
-def main():
-    # Load the JSON files
+def save_insights(insights, filename):
+    """
+    Writes the insights as a JSON array with one compact record per line, so
+    the file can be loaded whole or read back one record at a time.
+    """
+    if ORJSON_AVAILABLE:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj).encode("utf-8")
+    with open(filename, "wb") as f:
+        f.write(b"[\n")
+        for i, insight in enumerate(insights):
+            f.write((b",\n" if i else b"") + dumps(insight))
+        f.write(b"\n]\n")
+
+def process_one(session_dir):
+    """
+    Builds the per-segment emotion insights for one recording session directory
+    containing hume_analysis.json and transcript_raw.json.
+    """
+    # Stream emotion frames out of the Hume analysis data
     try:
-        hume_data = load_json("hume_analysis.json")
+        frames = extract_emotion_frames_from_file(os.path.join(session_dir, "hume_analysis.json"))
         print("Successfully loaded hume_analysis.json")
     except Exception as e:
         print(f"Error loading hume_analysis.json: {e}")
-        hume_data = {}
+        frames = _no_frames()
     
+    # Keep only the fields used below while streaming the transcript segments
+    ts_list, dur_list, texts = [], [], []
     try:
-        transcript_data = load_json("transcript_raw.json")
+        for segment in iter_segments(os.path.join(session_dir, "transcript_raw.json")):
+            try:
+                ts, dur, text = segment["timestamp_ms"], segment["duration_ms"], segment["transcription"]["transcript"]
+            except (KeyError, TypeError):
+                # Rare incomplete segment: fall back to defaults for missing fields
+                ts = segment.get("timestamp_ms", 0)
+                dur = segment.get("duration_ms", 0)
+                text = (segment.get("transcription") or {}).get("transcript", "")
+            ts_list.append(ts)
+            dur_list.append(dur)
+            texts.append(text)
         print("Successfully loaded transcript_raw.json")
     except Exception as e:
         print(f"Error loading transcript_raw.json: {e}")
-        transcript_data = []
+        ts_list, dur_list, texts = [], [], []
     
-    # Extract emotion frames from the Hume analysis data
-    frames = extract_emotion_frames(hume_data)
-    if not frames:
+    times, scores, names = build_frame_arrays(frames)
+    if not len(times):
         print("No emotion frames extracted.")
     
+    ts_ms = np.array(ts_list, dtype=np.float64)
+    dur_ms = np.array(dur_list, dtype=np.float64)
+    
     # Determine a baseline timestamp from the transcript data (in seconds)
-    if transcript_data:
-        baseline = min(segment.get("timestamp_ms", 0) for segment in transcript_data) / 1000.0
-    else:
-        baseline = 0
-
+    baseline = ts_ms.min() / 1000.0 if len(ts_ms) else 0
+    
+    # Convert transcript timestamps from milliseconds to seconds and make them relative to the baseline
+    starts = (ts_ms / 1000.0) - baseline
+    ends = starts + dur_ms / 1000.0
+    
+    # Compute average emotion scores for frames within every segment window
+    all_avg_emotions = average_emotions_for_segments(times, scores, names, starts, ends)
+    
     insights = []
-    for segment in transcript_data:
-        # Convert transcript timestamps from milliseconds to seconds and make them relative to the baseline
-        seg_start = (segment.get("timestamp_ms", 0) / 1000.0) - baseline
-        seg_duration = segment.get("duration_ms", 0) / 1000.0
-        seg_end = seg_start + seg_duration
-        
-        # Compute average emotion scores for frames within the segment window
-        avg_emotions = average_emotions_for_segment(frames, seg_start, seg_end)
+    for text, seg_start, seg_end, avg_emotions in zip(texts, starts.tolist(), ends.tolist(), all_avg_emotions):
         insights.append({
-            "transcript": segment.get("transcription", {}).get("transcript", ""),
+            "transcript": text,
             "start": seg_start,
             "end": seg_end,
             "avg_emotions": avg_emotions
@@ -135,20 +343,33 @@ def main():
         print("Average Emotion Scores:")
         if insight["avg_emotions"]:
             # Sort emotions by score (highest first) and show top 5
-            top_emotions = sorted(insight["avg_emotions"].items(), key=lambda x: x[1], reverse=True)[:5]
+            top_emotions = nlargest(5, insight["avg_emotions"].items(), key=itemgetter(1))
             for emotion, score in top_emotions:
                 print(f"  {emotion}: {score:.2f}")
         else:
             print("  No emotion data available for this segment.")
         print("\n" + "-"*50 + "\n")
+    
+    return insights
 
-    # Save insights to a JSON file
-    try:
-        with open("insights.json", "w", encoding="utf-8") as f:
-            json.dump(insights, f, indent=2)
-        print("Insights saved to insights.json")
-    except Exception as e:
-        print(f"Error saving insights to file: {e}")
+def main():
+    # Session directories to process, defaulting to the current one
+    session_dirs = sys.argv[1:] or ["."]
+    if len(session_dirs) == 1:
+        results = [process_one(session_dirs[0])]
+    else:
+        # Sessions are independent, so spread them across CPU cores
+        with ProcessPoolExecutor() as executor:
+            results = executor.map(process_one, session_dirs)
+    
+    # Save insights to a JSON file in each session directory
+    for session_dir, insights in zip(session_dirs, results):
+        filename = os.path.normpath(os.path.join(session_dir, "insights.json"))
+        try:
+            save_insights(insights, filename)
+            print(f"Insights saved to {filename}")
+        except Exception as e:
+            print(f"Error saving insights to file: {e}")
 
 if __name__ == "__main__":
     main()
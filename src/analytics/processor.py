@@ -7,6 +7,7 @@ and generates insights using an LLM (Claude Sonnet 3.7).
 
 import os
 import logging
+import dataclasses
 import json
 import time
 import re
@@ -14,6 +15,11 @@ from pathlib import Path
 import asyncio
 import tempfile
 import zipfile
+from contextlib import ExitStack
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
+import numpy as np
 import pandas as pd
 import requests
 from io import BytesIO
@@ -27,15 +33,273 @@ try:
 except ImportError:
     HUME_AVAILABLE = False
 
+# aiohttp is optional; without it downloads stream through requests in a worker thread
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# orjson is optional; without it results are written with the standard json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import Anthropic client for Claude
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks artifact downloads are streamed to disk in
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Maximum number of concurrent Hume prediction requests per processor
+MAX_CONCURRENT_PREDICTION_FETCHES = 4
+
+# Columns read from each model's artifact CSV
+ARTIFACT_CSV_COLUMNS = {
+    "face": {"frame", "time", "emotion", "score"},
+    "prosody": {"time", "emotion", "score"},
+    "language": {"text", "emotion", "score"},
+}
+# Emotion names repeat on every row, so they are parsed as categoricals
+ARTIFACT_CSV_DTYPES = {"emotion": "category", "time": "float64", "score": "float64"}
+# Rows per chunk when aggregating artifact CSVs
+ARTIFACT_CSV_CHUNK_SIZE = 100_000
+# Number of transcript characters included in each Claude prompt
+PROMPT_TRANSCRIPT_CHARS = 10000
+
+# Matches the model name in an artifact CSV file name
+_MODEL_TYPE_RE = re.compile(r"(face|prosody|language)", re.IGNORECASE)
+
+# A transcript line "timestamp | text", split at its first "|"
+_TRANSCRIPT_LINE_RE = re.compile(r"^([^|\n]*)\|([^\n]*)$", re.MULTILINE)
+# A question mark or a phrase that usually starts an interview question
+_QUESTION_RE = re.compile(
+    r"\?|tell me about|what is|how would|describe|explain|can you|do you|have you",
+    re.IGNORECASE
+)
+# Small talk, name queries and call logistics that are not interview questions
+_IRRELEVANT_QUESTION_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in [
+        "how are you", "nice to meet", "your name", "introduce yourself",
+        "weather", "doing today", "go for it", "pan", "testing", "hear me",
+        "can you see", "technical", "connection"
+    ]),
+    re.IGNORECASE
+)
+
+# Patterns for the string representation of Hume predictions (raw_result)
+_FACE_PREDICTION_RE = re.compile(r"FacePrediction\(frame=\d+,\s*time=([0-9.]+).*?emotions=\[(.*?)\]", re.DOTALL)
+_EMOTION_SCORE_RE = re.compile(r"EmotionScore\(name=['\"]([^'\"]+)['\"],\s*score=([0-9.]+)")
+
+def _to_serializable(obj):
+    """Convert a Hume SDK result to JSON-serializable data.
+    
+    Args:
+        obj: Result object, or a list of them
+        
+    Returns:
+        JSON-serializable data, or the string representation of unknown objects
+    """
+    if obj is None or isinstance(obj, (dict, str, int, float, bool)):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return [_to_serializable(item) for item in obj]
+    if hasattr(obj, "model_dump"):
+        # Pydantic v2 models; JSON mode also converts datetimes, enums and UUIDs
+        return obj.model_dump(mode="json")
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+def _segment_start_seconds(seg_start):
+    """Convert a transcript segment start to seconds.
+    
+    Floats below 1000 are taken to be seconds already, other numbers milliseconds.
+    """
+    if isinstance(seg_start, float) and seg_start < 1000:  # Likely already in seconds
+        return seg_start
+    if isinstance(seg_start, (int, float)):  # Likely in milliseconds
+        return seg_start / 1000.0
+    # Not a number; never falls inside a response window
+    return float('nan')
+
+def _timestamp_to_seconds(timestamp):
+    """Convert a "minutes:seconds" transcript timestamp to seconds, or 0 if malformed."""
+    try:
+        minutes, seconds = timestamp.split(':')
+        return int(minutes) * 60 + int(seconds)
+    except ValueError:
+        return 0
+
+def _timestamps_to_seconds(timestamps):
+    """Convert a batch of "minutes:seconds" transcript timestamps to seconds.
+    
+    Timestamps in the usual "MM:SS" form are converted together from their
+    character codes; any others go through _timestamp_to_seconds.
+    
+    Args:
+        timestamps: List of timestamp strings
+        
+    Returns:
+        list: Seconds for each timestamp, as ints
+    """
+    if not timestamps:
+        return []
+    
+    # View each timestamp as its five code points and check for "DD:DD"
+    stamps = np.array(timestamps)
+    fixed = np.char.str_len(stamps) == 5
+    codes = stamps[fixed].astype("U5").view(np.uint32).reshape(-1, 5)
+    digits = codes.astype(np.int64) - ord('0')
+    well_formed = ((codes[:, [0, 1, 3, 4]] - ord('0')) <= 9).all(axis=1) & (codes[:, 2] == ord(':'))
+    
+    seconds = np.zeros(len(timestamps), dtype=np.int64)
+    seconds[fixed] = digits[:, 0] * 600 + digits[:, 1] * 60 + digits[:, 3] * 10 + digits[:, 4]
+    fixed[fixed] = well_formed
+    
+    seconds = seconds.tolist()
+    for i in np.flatnonzero(~fixed).tolist():
+        seconds[i] = _timestamp_to_seconds(timestamps[i])
+    return seconds
+
+def _dedupe_key(item):
+    """Hashable key for deduplicating insight items, which may be dicts or lists."""
+    if isinstance(item, (dict, list)):
+        return json.dumps(item, sort_keys=True, default=str)
+    return item
+
+@lru_cache(maxsize=32)
+def _load_transcript_json(path, mtime_ns):
+    """Load and parse a raw transcript JSON file.
+    
+    The modification time is part of the cache key, so an updated file is
+    parsed again. The returned data is shared between callers and must not
+    be modified.
+    
+    Args:
+        path: Path to the transcript file
+        mtime_ns: Modification time of the file in nanoseconds
+        
+    Returns:
+        list: Transcript segments
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _prompt_json(data):
+    """Serialize data as indented JSON for embedding in a Claude prompt.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        str: JSON text indented by two spaces
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data, indent=2)
+
+def _accumulate_emotion_scores(grouped, sums, counts, time_series=None):
+    """Add one chunk's per-emotion score sums and counts (and time series).
+    
+    Args:
+        grouped: Artifact CSV chunk grouped by emotion
+        sums: Emotion name to running score sum
+        counts: Emotion name to running row count
+        time_series: Emotion name to list of (time, score) pairs, or None to skip
+    """
+    for emotion, group in grouped:
+        scores = group["score"]
+        sums[emotion] = sums.get(emotion, 0.0) + scores.sum()
+        counts[emotion] = counts.get(emotion, 0) + len(scores)
+        if time_series is not None:
+            time_series.setdefault(emotion, []).extend(zip(group["time"].tolist(), scores.tolist()))
+
+def _store_emotion_scores(sums, counts, model_data):
+    """Store the average score per emotion and the top 5 emotions.
+    
+    Args:
+        sums: Emotion name to total score
+        counts: Emotion name to number of rows
+        model_data: Model section of the combined data
+    """
+    # Sort by emotion name so the scores keep a stable key order
+    emotion_scores = {emotion: float(sums[emotion] / counts[emotion]) for emotion in sorted(sums)}
+    # Get top 5 emotions
+    top_emotions = nlargest(5, emotion_scores.items(), key=itemgetter(1))
+    
+    model_data["emotion_scores"] = emotion_scores
+    model_data["top_emotions"] = top_emotions
+
+def _process_face_csv(chunks, model_data):
+    """Extract emotion scores and time series from a face artifact CSV read in chunks."""
+    sums, counts, time_series = {}, {}, {}
+    has_time = False
+    for df in chunks:
+        if not ("frame" in df.columns and "emotion" in df.columns and "score" in df.columns):
+            return
+        has_time = "time" in df.columns
+        # One grouping pass per chunk feeds both the averages and the time series
+        grouped = df.groupby("emotion", sort=False, observed=True)
+        _accumulate_emotion_scores(grouped, sums, counts, time_series if has_time else None)
+    
+    _store_emotion_scores(sums, counts, model_data)
+    # Add time series data
+    if has_time:
+        model_data["time_series"] = time_series
+
+def _process_prosody_csv(chunks, model_data):
+    """Extract emotion scores and time series from a prosody artifact CSV read in chunks."""
+    sums, counts, time_series = {}, {}, {}
+    for df in chunks:
+        if not ("time" in df.columns and "emotion" in df.columns and "score" in df.columns):
+            return
+        # One grouping pass per chunk feeds both the averages and the time series
+        grouped = df.groupby("emotion", sort=False, observed=True)
+        _accumulate_emotion_scores(grouped, sums, counts, time_series)
+    
+    _store_emotion_scores(sums, counts, model_data)
+    # Add time series data
+    model_data["time_series"] = time_series
+
+def _process_language_csv(chunks, model_data):
+    """Extract emotion scores and text segments from a language artifact CSV read in chunks."""
+    sums, counts, text_segments = {}, {}, []
+    for df in chunks:
+        if not ("text" in df.columns and "emotion" in df.columns and "score" in df.columns):
+            return
+        _accumulate_emotion_scores(df.groupby("emotion", sort=False, observed=True), sums, counts)
+        
+        # Add text segments with emotions
+        text_segments.extend(
+            {"text": text, "emotion": emotion, "score": score}
+            for text, emotion, score in zip(
+                df["text"].to_numpy().tolist(), df["emotion"].to_numpy().tolist(), df["score"].to_numpy().tolist()
+            )
+        )
+    
+    _store_emotion_scores(sums, counts, model_data)
+    model_data["text_segments"] = text_segments
+
+# Handlers filling a model's section of the combined data from its artifact
+# CSV, given as an iterable of DataFrame chunks
+_MODEL_CSV_HANDLERS = {
+    "face": _process_face_csv,
+    "prosody": _process_prosody_csv,
+    "language": _process_language_csv,
+}
+
 class AnalyticsProcessor:
     """Processes interview recordings using Hume AI and generates insights using an LLM."""
     
@@ -48,17 +312,40 @@ class AnalyticsProcessor:
         self.config = config
         self.hume_client = None
         self.anthropic_client = None
+        # HTTP session shared by the artifact downloads of every recording in
+        # flight (created on first use, closed by the owner via close())
+        self._http_session = None
+        # Limits concurrent prediction requests when many recordings are in flight
+        self._predictions_semaphore = asyncio.Semaphore(MAX_CONCURRENT_PREDICTION_FETCHES)
+        # Last (file versions, segments) computed by _extract_emotion_data
+        self._emotion_data_cache = None
+        # Last (segments, transcript, qa_pairs) computed by _filter_relevant_questions
+        self._qa_pairs_cache = None
         
         # Initialize Hume AI client if available
         if HUME_AVAILABLE and config.hume_api_key:
             self.hume_client = AsyncHumeClient(api_key=config.hume_api_key)
+            
+            # The job configuration is the same for every recording, so build it once
+            models_chosen = Models(
+                language=Language(),
+                prosody=Prosody(),
+                face=Face()
+            )
+            
+            self._inference_request = InferenceBaseRequest(models=models_chosen)
+            
+            # Headers for direct Hume API calls
+            self._hume_headers = {
+                "X-Hume-Api-Key": config.hume_api_key
+            }
             logger.info("Initialized Hume AI client")
         else:
             logger.warning("Hume AI not available or API key not provided")
         
         # Initialize Anthropic client for Claude if available
         if ANTHROPIC_AVAILABLE and config.anthropic_api_key:
-            self.anthropic_client = Anthropic(api_key=config.anthropic_api_key)
+            self.anthropic_client = AsyncAnthropic(api_key=config.anthropic_api_key)
             logger.info("Initialized Anthropic client for Claude")
         else:
             logger.warning("Anthropic client not available or API key not provided")
@@ -80,74 +367,19 @@ class AnalyticsProcessor:
             return {}
         
         try:
-            # Create configurations for each model
-            language_config = Language()
-            prosody_config = Prosody()
-            face_config = Face()
-            
-            # Create a Models object
-            models_chosen = Models(
-                language=language_config,
-                prosody=prosody_config,
-                face=face_config
-            )
-            
             # Open the recording file
             with open(recording_path, mode="rb") as file:
-                # Create a stringified object containing the configuration
-                stringified_configs = InferenceBaseRequest(models=models_chosen)
-                
                 # Start an inference job
                 logger.info(f"Starting Hume AI inference job for: {recording_path}")
                 job_id = await self.hume_client.expression_measurement.batch.start_inference_job_from_local_file(
-                    json=stringified_configs, 
+                    json=self._inference_request, 
                     file=[file]
                 )
                 
                 logger.info(f"Submitted job to Hume AI: {job_id}")
                 
-                # Wait for job to complete (not recommended to poll, but we need the results)
-                # In production, we should use webhooks
-                job_complete = False
-                max_retries = 30  # Maximum number of retries
-                retry_count = 0
-                
-                while not job_complete and retry_count < max_retries:
-                    try:
-                        # Get job details
-                        job_details = await self.hume_client.expression_measurement.batch.get_job_details(id=job_id)
-                        
-                        # Check job status - the structure depends on the actual API response
-                        if hasattr(job_details, "state") and hasattr(job_details.state, "status"):
-                            status = job_details.state.status
-                        elif hasattr(job_details, "status"):
-                            status = job_details.status
-                        elif isinstance(job_details, dict):
-                            status = job_details.get("status")
-                        else:
-                            # Log the actual structure for debugging
-                            logger.info(f"Job details type: {type(job_details)}")
-                            logger.info(f"Job details: {job_details}")
-                            status = str(job_details)
-                        
-                        logger.info(f"Job status: {status}")
-                        
-                        if status == "COMPLETED":
-                            job_complete = True
-                        elif status == "FAILED":
-                            raise Exception(f"Hume AI job failed: {job_details}")
-                        else:
-                            # Wait before checking again
-                            retry_count += 1
-                            logger.info(f"Job in progress, waiting... (attempt {retry_count}/{max_retries})")
-                            await asyncio.sleep(10)  # Wait 10 seconds before checking again
-                    except Exception as e:
-                        logger.exception(f"Error checking job status: {e}")
-                        retry_count += 1
-                        await asyncio.sleep(10)  # Wait 10 seconds before trying again
-                
-                if not job_complete:
-                    raise Exception(f"Hume AI job timed out after {max_retries} retries")
+                # Wait for the job to complete, polling with backoff
+                await self._await_job(job_id, getattr(self.config, "hume_job_timeout", 300))
                 
                 # Get the output directory (same as where the recording is stored)
                 output_dir = os.path.dirname(recording_path)
@@ -156,118 +388,65 @@ class AnalyticsProcessor:
                 artifacts_dir = os.path.join(output_dir, "hume_artifacts")
                 os.makedirs(artifacts_dir, exist_ok=True)
                 
-                # Download job artifacts (ZIP file with CSVs)
-                logger.info(f"Downloading artifacts for job: {job_id}")
+                # Download the artifacts and fetch the predictions concurrently
+                zip_path, result_dict = await asyncio.gather(
+                    self._download_artifacts(job_id, artifacts_dir),
+                    self._fetch_predictions(job_id),
+                    return_exceptions=True
+                )
+                if isinstance(result_dict, BaseException):
+                    raise result_dict
                 
-                # Direct API call to get artifacts (ZIP file)
-                api_key = self.config.hume_api_key
-                artifacts_url = f"https://api.hume.ai/v0/batch/jobs/{job_id}/artifacts"
+                if not isinstance(zip_path, BaseException):
+                    try:
+                        # Process each CSV file and combine data
+                        combined_data = await self._process_artifact_csvs(zip_path, metadata={"transcript_path": transcript_path})
+                        
+                        # Save combined data to JSON in the same directory as the recording,
+                        # and the predictions to their own file for backward compatibility
+                        combined_path = os.path.join(output_dir, "hume_analysis.json")
+                        predictions_path = os.path.join(output_dir, "hume_predictions.json")
+                        await asyncio.gather(
+                            asyncio.to_thread(self._write_json, combined_path, combined_data),
+                            asyncio.to_thread(self._write_json, predictions_path, result_dict)
+                        )
+                        
+                        logger.info(f"Saved combined Hume AI analysis to {combined_path}")
+                        logger.info(f"Saved Hume AI predictions to {predictions_path}")
+                        
+                        # Merge predictions with combined data
+                        combined_data["predictions"] = result_dict
+                        
+                        return {
+                            "result": combined_data,
+                            "result_path": combined_path,
+                            "artifacts_dir": artifacts_dir
+                        }
+                    except Exception as e:
+                        logger.exception(f"Error processing artifacts: {e}")
+                else:
+                    logger.error(f"Error downloading artifacts: {zip_path}")
                 
-                headers = {
-                    "X-Hume-Api-Key": api_key
-                }
+                # Fall back to just the predictions
+                logger.info("Falling back to predictions only")
                 
-                try:
-                    artifacts_response = requests.get(artifacts_url, headers=headers)
-                    artifacts_response.raise_for_status()
-                    
-                    # Save the zip file
-                    zip_path = os.path.join(artifacts_dir, "artifacts.zip")
-                    with open(zip_path, 'wb') as f:
-                        f.write(artifacts_response.content)
-                    
-                    logger.info(f"Downloaded artifacts to: {zip_path}")
-                    
-                    # Extract the zip file
-                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                        zip_ref.extractall(artifacts_dir)
-                    
-                    logger.info(f"Extracted artifacts to: {artifacts_dir}")
-                    
-                    # Process each CSV file and combine data
-                    combined_data = self._process_artifact_csvs(artifacts_dir, metadata={"transcript_path": transcript_path})
-                    
-                    # Save combined data to JSON in the same directory as the recording
-                    combined_path = os.path.join(output_dir, "hume_analysis.json")
-                    with open(combined_path, 'w', encoding='utf-8') as f:
-                        json.dump(combined_data, f, indent=2)
-                    
-                    logger.info(f"Saved combined Hume AI analysis to {combined_path}")
-                    
-                    # Also get the predictions for backward compatibility
-                    result = await self.hume_client.expression_measurement.batch.get_job_predictions(id=job_id)
-                    
-                    # Convert to serializable format if needed
-                    if hasattr(result, "model_dump"):
-                        result_dict = result.model_dump()
-                    elif hasattr(result, "dict"):
-                        result_dict = result.dict()
-                    elif not isinstance(result, dict):
-                        # Try to convert to dict using __dict__ if available
-                        if hasattr(result, "__dict__"):
-                            result_dict = result.__dict__
-                        else:
-                            # Fallback to string representation
-                            result_dict = {"raw_result": str(result)}
-                    else:
-                        result_dict = result
-                    
-                    # Save predictions to file
-                    predictions_path = os.path.join(output_dir, "hume_predictions.json")
-                    with open(predictions_path, 'w', encoding='utf-8') as f:
-                        json.dump(result_dict, f, indent=2)
-                    
-                    logger.info(f"Saved Hume AI predictions to {predictions_path}")
-                    
-                    # Merge predictions with combined data
-                    combined_data["predictions"] = result_dict
-                    
-                    return {
-                        "result": combined_data,
-                        "result_path": combined_path,
-                        "artifacts_dir": artifacts_dir
-                    }
-                    
-                except Exception as e:
-                    logger.exception(f"Error downloading or processing artifacts: {e}")
-                    # Fall back to just getting predictions
-                    logger.info("Falling back to getting predictions only")
-                    result = await self.hume_client.expression_measurement.batch.get_job_predictions(id=job_id)
-                    
-                    # Convert to serializable format if needed
-                    if hasattr(result, "model_dump"):
-                        result_dict = result.model_dump()
-                    elif hasattr(result, "dict"):
-                        result_dict = result.dict()
-                    elif not isinstance(result, dict):
-                        # Try to convert to dict using __dict__ if available
-                        if hasattr(result, "__dict__"):
-                            result_dict = result.__dict__
-                        else:
-                            # Fallback to string representation
-                            result_dict = {"raw_result": str(result)}
-                    else:
-                        result_dict = result
-                    
-                    # Save result to file
-                    result_path = os.path.join(output_dir, "hume_analysis.json")
-                    with open(result_path, 'w', encoding='utf-8') as f:
-                        json.dump(result_dict, f, indent=2)
-                    
-                    logger.info(f"Saved Hume AI analysis to {result_path}")
-                    
-                    return {
-                        "result": result_dict,
-                        "result_path": result_path
-                    }
+                # Save result to file
+                result_path = os.path.join(output_dir, "hume_analysis.json")
+                await asyncio.to_thread(self._write_json, result_path, result_dict)
+                
+                logger.info(f"Saved Hume AI analysis to {result_path}")
+                
+                return {
+                    "result": result_dict,
+                    "result_path": result_path
+                }
                 
         except Exception as e:
             logger.exception(f"Error processing recording with Hume AI: {e}")
             # Create a mock result for testing purposes
             mock_result = self._create_mock_hume_result()
             result_path = os.path.join(os.path.dirname(recording_path), "hume_analysis_mock.json")
-            with open(result_path, 'w', encoding='utf-8') as f:
-                json.dump(mock_result, f, indent=2)
+            self._write_json(result_path, mock_result)
             
             logger.info(f"Saved mock Hume AI analysis to {result_path}")
             
@@ -276,23 +455,205 @@ class AnalyticsProcessor:
                 "result_path": result_path
             }
     
-    def _process_artifact_csvs(self, artifact_dir, metadata=None):
-        """Process CSV files from the artifacts directory.
+    @staticmethod
+    def _write_json(path, data):
+        """Write data to a JSON file indented by two spaces.
+        
+        Args:
+            path: Destination file path
+            data: JSON-serializable data
+        """
+        if ORJSON_AVAILABLE:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+    
+    async def close(self):
+        """Close the HTTP session used for artifact downloads.
+        
+        Call this once no recordings are being processed any more, or use the
+        processor as an async context manager.
+        """
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _get_http_session(self):
+        """Get the shared aiohttp session, creating it on first use."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=16))
+        return self._http_session
+    
+    async def _download_file(self, url, headers, path):
+        """Stream a file from a URL to disk in chunks.
+        
+        Args:
+            url: URL to download
+            headers: Request headers
+            path: Destination file path
+        """
+        if AIOHTTP_AVAILABLE:
+            async with self._get_http_session().get(url, headers=headers) as response:
+                response.raise_for_status()
+                with open(path, 'wb') as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(f.write, chunk)
+        else:
+            await asyncio.to_thread(self._download_file_sync, url, headers, path)
+    
+    @staticmethod
+    def _download_file_sync(url, headers, path):
+        """Stream a file from a URL to disk with requests (blocking)."""
+        with requests.get(url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            with open(path, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+    
+    @staticmethod
+    def _extract_zip(zip_path, target_dir):
+        """Extract a zip file into a directory."""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(target_dir)
+    
+    async def _download_artifacts(self, job_id, artifacts_dir):
+        """Download the artifacts (ZIP file with CSVs) of a Hume AI job.
+        
+        Args:
+            job_id: ID of the completed Hume AI job
+            artifacts_dir: Directory to store the artifacts in
+            
+        Returns:
+            str: Path to the downloaded zip file
+        """
+        logger.info(f"Downloading artifacts for job: {job_id}")
+        
+        # Direct API call to get artifacts (ZIP file)
+        artifacts_url = f"https://api.hume.ai/v0/batch/jobs/{job_id}/artifacts"
+        
+        # Stream the zip file to disk
+        zip_path = os.path.join(artifacts_dir, "artifacts.zip")
+        await self._download_file(artifacts_url, self._hume_headers, zip_path)
+        
+        logger.info(f"Downloaded artifacts to: {zip_path}")
+        
+        # The CSVs are read straight from the zip file; extract them only if asked to
+        if getattr(self.config, "persist_artifacts", False):
+            await asyncio.to_thread(self._extract_zip, zip_path, artifacts_dir)
+            logger.info(f"Extracted artifacts to: {artifacts_dir}")
+        
+        return zip_path
+    
+    async def _fetch_predictions(self, job_id):
+        """Fetch the predictions of a completed Hume AI job.
         
         Args:
-            artifact_dir: Directory containing the artifacts
+            job_id: ID of the completed Hume AI job
+            
+        Returns:
+            list or dict: Predictions in a JSON-serializable format
+        """
+        # Bound concurrent prediction requests to stay within Hume's rate limit
+        async with self._predictions_semaphore:
+            result = await self.hume_client.expression_measurement.batch.get_job_predictions(id=job_id)
+        
+        # Convert to serializable format if needed
+        result_data = _to_serializable(result)
+        if isinstance(result_data, str):
+            # Fallback to string representation
+            return {"raw_result": result_data}
+        return result_data
+    
+    async def _get_job_status(self, job_id):
+        """Fetch the current status of a Hume AI job.
+        
+        Args:
+            job_id: ID of the Hume AI job
+            
+        Returns:
+            tuple: (status, job_details)
+        """
+        job_details = await self.hume_client.expression_measurement.batch.get_job_details(id=job_id)
+        
+        # Check job status - the structure depends on the actual API response
+        if hasattr(job_details, "state") and hasattr(job_details.state, "status"):
+            status = job_details.state.status
+        elif hasattr(job_details, "status"):
+            status = job_details.status
+        elif isinstance(job_details, dict):
+            status = job_details.get("status")
+        else:
+            # Log the actual structure for debugging
+            logger.info(f"Job details type: {type(job_details)}")
+            logger.info(f"Job details: {job_details}")
+            status = str(job_details)
+        
+        return status, job_details
+    
+    async def _await_job(self, job_id, timeout):
+        """Wait for a Hume AI job to complete.
+        
+        The job status is checked with exponential backoff (1s, 2s, 4s, ...
+        capped at 30s). Errors while checking the status are logged and the
+        status is checked again, until the timeout runs out.
+        
+        Args:
+            job_id: ID of the Hume AI job
+            timeout: Maximum number of seconds to wait
+        """
+        async def poll():
+            delay = 1
+            while True:
+                try:
+                    status, job_details = await self._get_job_status(job_id)
+                except Exception as e:
+                    logger.exception(f"Error checking job status: {e}")
+                else:
+                    logger.info(f"Job status: {status}")
+                    
+                    if status == "COMPLETED":
+                        return
+                    if status == "FAILED":
+                        raise Exception(f"Hume AI job failed: {job_details}")
+                    
+                    logger.info(f"Job in progress, checking again in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+        
+        try:
+            await asyncio.wait_for(poll(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise Exception(f"Hume AI job timed out after {timeout} seconds")
+    
+    async def _process_artifact_csvs(self, artifact_path, metadata=None):
+        """Process CSV files from the artifacts ZIP file or directory.
+        
+        The CSV files are independent, so they are parsed concurrently in
+        worker threads and merged afterwards.
+        
+        Args:
+            artifact_path: Artifacts ZIP file, or a directory with extracted artifacts
             metadata: Meeting metadata (optional)
             
         Returns:
             dict: Combined data from all CSV files
         """
         try:
-            # Find all CSV files in the artifacts directory
-            csv_files = []
-            for root, _, files in os.walk(artifact_dir):
-                for file in files:
-                    if file.endswith(".csv"):
-                        csv_files.append(os.path.join(root, file))
+            # Find all CSV files in the artifacts, relative to the ZIP file or directory
+            if os.path.isdir(artifact_path):
+                artifact_root = Path(artifact_path)
+                csv_files = [str(csv_path.relative_to(artifact_root)) for csv_path in artifact_root.rglob("*.csv")]
+            else:
+                with zipfile.ZipFile(artifact_path, 'r') as zip_ref:
+                    csv_files = [info.filename for info in zip_ref.infolist() if info.filename.endswith(".csv")]
             
             # Initialize combined data structure
             combined_data = {
@@ -306,90 +667,21 @@ class AnalyticsProcessor:
             
             logger.info(f"Found {len(csv_files)} CSV files")
             
-            # Process each CSV file
-            for csv_file in csv_files:
-                file_name = os.path.basename(csv_file)
-                logger.info(f"Processing CSV file: {file_name}")
-                
-                try:
-                    # Read CSV file
-                    df = pd.read_csv(csv_file)
-                    
-                    # Determine which model this CSV belongs to
-                    if "face" in file_name.lower():
-                        model_type = "face"
-                    elif "prosody" in file_name.lower():
-                        model_type = "prosody"
-                    elif "language" in file_name.lower():
-                        model_type = "language"
-                    else:
-                        model_type = "other"
-                    
-                    # Extract key information based on model type
-                    if model_type == "face":
-                        # Process face data
-                        if "frame" in df.columns and "emotion" in df.columns and "score" in df.columns:
-                            # Group by emotion and calculate average score
-                            emotion_scores = df.groupby("emotion")["score"].mean().to_dict()
-                            # Get top emotions
-                            top_emotions = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)
-                            
-                            combined_data["face"]["emotion_scores"] = emotion_scores
-                            combined_data["face"]["top_emotions"] = top_emotions[:5]  # Top 5 emotions
-                            
-                            # Add time series data
-                            if "time" in df.columns:
-                                time_series = {}
-                                for emotion in df["emotion"].unique():
-                                    emotion_df = df[df["emotion"] == emotion]
-                                    time_series[emotion] = list(zip(emotion_df["time"].tolist(), emotion_df["score"].tolist()))
-                                combined_data["face"]["time_series"] = time_series
-                    
-                    elif model_type == "prosody":
-                        # Process prosody data
-                        if "time" in df.columns and "emotion" in df.columns and "score" in df.columns:
-                            # Group by emotion and calculate average score
-                            emotion_scores = df.groupby("emotion")["score"].mean().to_dict()
-                            # Get top emotions
-                            top_emotions = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)
-                            
-                            combined_data["prosody"]["emotion_scores"] = emotion_scores
-                            combined_data["prosody"]["top_emotions"] = top_emotions[:5]  # Top 5 emotions
-                            
-                            # Add time series data
-                            time_series = {}
-                            for emotion in df["emotion"].unique():
-                                emotion_df = df[df["emotion"] == emotion]
-                                time_series[emotion] = list(zip(emotion_df["time"].tolist(), emotion_df["score"].tolist()))
-                            combined_data["prosody"]["time_series"] = time_series
-                    
-                    elif model_type == "language":
-                        # Process language data
-                        if "text" in df.columns and "emotion" in df.columns and "score" in df.columns:
-                            # Group by emotion and calculate average score
-                            emotion_scores = df.groupby("emotion")["score"].mean().to_dict()
-                            # Get top emotions
-                            top_emotions = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)
-                            
-                            combined_data["language"]["emotion_scores"] = emotion_scores
-                            combined_data["language"]["top_emotions"] = top_emotions[:5]  # Top 5 emotions
-                            
-                            # Add text segments with emotions
-                            text_segments = []
-                            for _, row in df.iterrows():
-                                if "text" in row and "emotion" in row and "score" in row:
-                                    text_segments.append({
-                                        "text": row["text"],
-                                        "emotion": row["emotion"],
-                                        "score": row["score"]
-                                    })
-                            combined_data["language"]["text_segments"] = text_segments
-                    
-                    # Save the raw data as well
-                    combined_data[model_type][file_name] = df.to_dict(orient="records")
-                    
-                except Exception as e:
-                    logger.exception(f"Error processing CSV file {file_name}: {e}")
+            # Process each CSV file in its own thread
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._process_one_csv, artifact_path, csv_file) for csv_file in csv_files)
+            )
+            
+            # Merge the per-file results
+            for result in results:
+                if result is None:
+                    continue
+                model_type, file_data = result
+                model_data = combined_data.setdefault(model_type, {})
+                sources = file_data.pop("sources", None)
+                model_data.update(file_data)
+                if sources:
+                    model_data.setdefault("sources", []).extend(sources)
             
             # Generate summary across all models
             self._generate_summary(combined_data)
@@ -405,6 +697,86 @@ class AnalyticsProcessor:
             logger.exception(f"Error processing artifact CSVs: {e}")
             return {"error": str(e)}
     
+    def _process_one_csv(self, artifact_path, csv_file):
+        """Process a single Hume artifact CSV file.
+        
+        Args:
+            artifact_path: Artifacts ZIP file, or a directory with extracted artifacts
+            csv_file: Path of the CSV file inside the artifacts
+            
+        Returns:
+            tuple: (model_type, data extracted for that model), or None on error
+        """
+        file_name = os.path.basename(csv_file)
+        logger.info(f"Processing CSV file: {file_name}")
+        
+        try:
+            # Determine which model this CSV belongs to
+            match = _MODEL_TYPE_RE.search(file_name)
+            model_type = match.group(1).lower() if match else "other"
+            
+            handler = _MODEL_CSV_HANDLERS.get(model_type)
+            keep_raw_csv = getattr(self.config, "keep_raw_csv", False)
+            model_data = {}
+            
+            with ExitStack() as stack:
+                if os.path.isdir(artifact_path):
+                    source = os.path.join(artifact_path, csv_file)
+                else:
+                    # Each thread opens its own handle on the ZIP file
+                    zip_ref = stack.enter_context(zipfile.ZipFile(artifact_path, 'r'))
+                    source = stack.enter_context(zip_ref.open(csv_file))
+                
+                if keep_raw_csv:
+                    # The raw rows are stored as they are, with every column
+                    df = pd.read_csv(source)
+                    if handler is not None:
+                        handler([df], model_data)
+                elif handler is not None:
+                    # Aggregate in chunks so large face CSVs never sit in memory whole
+                    chunks = self._read_artifact_csv(source, model_type, chunksize=ARTIFACT_CSV_CHUNK_SIZE)
+                    with chunks:
+                        handler(chunks, model_data)
+            
+            # Record where the raw data lives; embed the rows only if configured to
+            if keep_raw_csv:
+                model_data[file_name] = df.to_dict(orient="records")
+            else:
+                model_data["sources"] = [csv_file]
+            
+            return model_type, model_data
+            
+        except Exception as e:
+            logger.exception(f"Error processing CSV file {file_name}: {e}")
+            return None
+    
+    def _read_artifact_csv(self, csv_file, model_type, chunksize=None):
+        """Read a Hume artifact CSV, parsing only the columns its model uses if it is in long format.
+        
+        Args:
+            csv_file: Path to the CSV file, or a file object
+            model_type: Model the CSV belongs to (face, prosody, language or other)
+            chunksize: Number of rows per chunk, or None to read the whole file
+            
+        Returns:
+            DataFrame: The CSV data, or a reader yielding DataFrame chunks if chunksize is set
+        """
+        columns = ARTIFACT_CSV_COLUMNS.get(model_type)
+        if columns is not None:
+            # Only long-format CSVs (one row per emotion) have an emotion
+            # column; wide ones have a column per emotion and are read whole
+            header = pd.read_csv(csv_file, nrows=0).columns
+            if not isinstance(csv_file, (str, os.PathLike)):
+                csv_file.seek(0)
+            if "emotion" not in header:
+                columns = None
+        if columns is None:
+            # Unknown CSV layout, keep every column
+            return pd.read_csv(csv_file, chunksize=chunksize)
+        
+        # A callable keeps read_csv from failing when an expected column is missing
+        return pd.read_csv(csv_file, usecols=columns.__contains__, dtype=ARTIFACT_CSV_DTYPES, chunksize=chunksize)
+    
     def _generate_summary(self, combined_data):
         """Generate a summary of the combined data.
         
@@ -432,11 +804,11 @@ class AnalyticsProcessor:
                 if scores:
                     emotion_scores[emotion] = sum(scores) / len(scores)
             
-            # Get top emotions
-            top_emotions = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)
+            # Get top 5 emotions
+            top_emotions = nlargest(5, emotion_scores.items(), key=itemgetter(1))
             
             summary["emotion_scores"] = emotion_scores
-            summary["top_emotions"] = top_emotions[:5]  # Top 5 emotions
+            summary["top_emotions"] = top_emotions
             
             # Add model-specific summaries
             model_summaries = {}
@@ -451,8 +823,8 @@ class AnalyticsProcessor:
             # Add to combined data
             combined_data["summary"] = summary
             
-            # Extract emotion frames from raw result if available
-            if "raw_result" in combined_data:
+            # Extract emotion frames from the predictions if available
+            if "raw_result" in combined_data or self._find_structured_predictions(combined_data) is not None:
                 emotion_frames = self._extract_emotion_frames_from_raw(combined_data)
                 if emotion_frames:
                     combined_data["emotion_frames"] = emotion_frames
@@ -471,6 +843,14 @@ class AnalyticsProcessor:
             list: List of emotion frames
         """
         try:
+            # Walk structured predictions directly when they are available
+            predictions = self._find_structured_predictions(hume_data)
+            if predictions is not None:
+                frames = self._extract_emotion_frames_from_predictions(predictions)
+                logger.info(f"Extracted {len(frames)} frames with emotion data")
+                return frames
+            
+            # Otherwise fall back to parsing the raw_result string
             # First check if the raw_result is directly in hume_data
             raw = hume_data.get("raw_result", "")
             
@@ -478,13 +858,20 @@ class AnalyticsProcessor:
             if not raw and "result" in hume_data:
                 raw = hume_data.get("result", {}).get("raw_result", "")
             
+            # Or under the predictions merged into the combined data
+            if not raw:
+                for container in (hume_data, hume_data.get("result")):
+                    predictions = container.get("predictions") if isinstance(container, dict) else None
+                    if isinstance(predictions, dict) and predictions.get("raw_result"):
+                        raw = predictions["raw_result"]
+                        break
+            
             if not raw:
                 logger.warning("No raw_result field found in Hume data.")
                 return []
             
-            # Pattern to capture FacePrediction blocks with time and emotions
-            pattern = r"FacePrediction\(frame=\d+,\s*time=([0-9.]+).*?emotions=\[(.*?)\]"
-            matches = re.findall(pattern, raw, re.DOTALL)
+            # Capture FacePrediction blocks with time and emotions
+            matches = _FACE_PREDICTION_RE.findall(raw)
             
             frames = []
             for time_str, emotions_str in matches:
@@ -493,9 +880,8 @@ class AnalyticsProcessor:
                 except ValueError:
                     continue
 
-                # Pattern to capture individual emotion entries
-                emotion_pattern = r"EmotionScore\(name=['\"]([^'\"]+)['\"],\s*score=([0-9.]+)"
-                emotion_matches = re.findall(emotion_pattern, emotions_str)
+                # Capture individual emotion entries
+                emotion_matches = _EMOTION_SCORE_RE.findall(emotions_str)
                 
                 emotions = []
                 for name, score_str in emotion_matches:
@@ -515,6 +901,52 @@ class AnalyticsProcessor:
             logger.exception(f"Error extracting emotion frames: {e}")
             return []
     
+    def _find_structured_predictions(self, hume_data):
+        """Find Hume predictions that were kept as structured data.
+        
+        Args:
+            hume_data: Hume AI analysis data
+            
+        Returns:
+            list: Job predictions, or None if only a raw_result string is available
+        """
+        candidates = [hume_data.get("predictions")]
+        result = hume_data.get("result")
+        if isinstance(result, dict):
+            candidates.append(result.get("predictions"))
+        elif isinstance(result, list):
+            candidates.append(result)
+        
+        for predictions in candidates:
+            if isinstance(predictions, dict) and "results" in predictions:
+                return [predictions]
+            if isinstance(predictions, list) and predictions and isinstance(predictions[0], dict):
+                return predictions
+        return None
+    
+    def _extract_emotion_frames_from_predictions(self, predictions):
+        """Extract face emotion frames from structured Hume job predictions.
+        
+        Args:
+            predictions: List of job predictions as returned by get_job_predictions
+            
+        Returns:
+            list: List of emotion frames
+        """
+        frames = []
+        for job_prediction in predictions:
+            for file_prediction in (job_prediction.get("results") or {}).get("predictions") or []:
+                face = (file_prediction.get("models") or {}).get("face") or {}
+                for group in face.get("grouped_predictions") or []:
+                    for frame in group.get("predictions") or []:
+                        emotions = [
+                            {"name": emotion["name"], "score": float(emotion.get("score") or 0.0)}
+                            for emotion in frame.get("emotions") or []
+                        ]
+                        if emotions and frame.get("time") is not None:  # Only add frames that have emotion data
+                            frames.append({"time": float(frame["time"]), "emotions": emotions})
+        return frames
+    
     def _process_transcript_with_emotions(self, transcript_path, emotion_frames):
         """Process transcript and map emotion data to transcript segments.
         
@@ -526,9 +958,8 @@ class AnalyticsProcessor:
             list: List of transcript segments with emotion data
         """
         try:
-            # Load transcript data
-            with open(transcript_path, 'r', encoding='utf-8') as f:
-                transcript_data = json.load(f)
+            # Load transcript data (parsed once per file version)
+            transcript_data = _load_transcript_json(transcript_path, os.stat(transcript_path).st_mtime_ns)
             
             # Determine a baseline timestamp from the transcript data (in seconds)
             if transcript_data:
@@ -536,6 +967,9 @@ class AnalyticsProcessor:
             else:
                 baseline = 0
             
+            # Convert the frames to arrays once instead of scanning them per segment
+            frame_arrays = self._build_emotion_arrays(emotion_frames)
+            
             insights = []
             for segment in transcript_data:
                 # Convert transcript timestamps from milliseconds to seconds and make them relative to the baseline
@@ -544,7 +978,7 @@ class AnalyticsProcessor:
                 seg_end = seg_start + seg_duration
                 
                 # Compute average emotion scores for frames within the segment window
-                avg_emotions = self._average_emotions_for_segment(emotion_frames, seg_start, seg_end)
+                avg_emotions = self._average_emotions_for_segment(frame_arrays, seg_start, seg_end)
                 insights.append({
                     "transcript": segment.get("transcription", {}).get("transcript", ""),
                     "start": seg_start,
@@ -558,33 +992,54 @@ class AnalyticsProcessor:
             logger.exception(f"Error processing transcript with emotions: {e}")
             return []
     
-    def _average_emotions_for_segment(self, frames, start_time, end_time):
-        """Calculate average emotion scores for frames within a time window.
+    def _build_emotion_arrays(self, frames):
+        """Convert emotion frames to arrays sorted by frame time.
         
         Args:
             frames: List of emotion frames
+            
+        Returns:
+            tuple: (times, scores, present, names) where scores and present are
+                (frames x emotions) arrays; present marks the emotions a frame reported
+        """
+        names = list(dict.fromkeys(emotion.get("name") for frame in frames for emotion in frame.get("emotions", [])))
+        name_to_col = {name: col for col, name in enumerate(names)}
+        
+        times = np.array([frame.get("time", 0) for frame in frames], dtype=np.float64)
+        scores = np.zeros((len(frames), len(names)), dtype=np.float64)
+        present = np.zeros((len(frames), len(names)), dtype=bool)
+        for row, frame in enumerate(frames):
+            for emotion in frame.get("emotions", []):
+                col = name_to_col[emotion.get("name")]
+                scores[row, col] = emotion.get("score", 0)
+                present[row, col] = True
+        
+        # Segment windows are found by binary search, which needs sorted times
+        order = np.argsort(times, kind="stable")
+        return times[order], scores[order], present[order], names
+    
+    def _average_emotions_for_segment(self, frame_arrays, start_time, end_time):
+        """Calculate average emotion scores for frames within a time window.
+        
+        Args:
+            frame_arrays: Emotion frame arrays from _build_emotion_arrays
             start_time: Start time of the segment (in seconds)
             end_time: End time of the segment (in seconds)
             
         Returns:
             dict: Average emotion scores for the segment
         """
-        # Filter frames that fall within the provided time window
-        selected = [frame for frame in frames if start_time <= frame.get("time", 0) <= end_time]
-        if not selected:
-            return {}
+        times, scores, present, names = frame_arrays
         
-        emotion_totals = {}
-        count = 0
-        for frame in selected:
-            for emotion in frame.get("emotions", []):
-                name = emotion.get("name")
-                score = emotion.get("score", 0)
-                emotion_totals[name] = emotion_totals.get(name, 0) + score
-            count += 1
+        # Find the frames that fall within the provided time window
+        lo = np.searchsorted(times, start_time, "left")
+        hi = np.searchsorted(times, end_time, "right")
+        if hi <= lo:
+            return {}
         
-        avg_emotions = {name: total / count for name, total in emotion_totals.items()}
-        return avg_emotions
+        avg_scores = scores[lo:hi].mean(axis=0)
+        seen = present[lo:hi].any(axis=0)
+        return {name: score for name, score, was_seen in zip(names, avg_scores.tolist(), seen.tolist()) if was_seen}
 
     async def generate_insights(self, analytics_data, transcript_path=None, candidate_name="Candidate"):
         """Generate insights from Hume AI analytics data using Claude.
@@ -612,11 +1067,12 @@ class AnalyticsProcessor:
         # Extract emotion data from analytics
         transcript_with_emotions = self._extract_emotion_data(analytics_data)
         
-        # Step 1: Generate primary insights using Claude 3.7 Sonnet
-        primary_insights = await self._generate_primary_insights(transcript_with_emotions, transcript, candidate_name)
-        
-        # Step 2: Generate emotional analysis using Claude 3.7 Sonnet
-        emotional_analysis = await self._generate_emotional_analysis(transcript_with_emotions, transcript, candidate_name)
+        # Steps 1 and 2: Generate primary insights and emotional analysis using Claude 3.7 Sonnet.
+        # The two requests are independent, so they run concurrently.
+        primary_insights, emotional_analysis = await asyncio.gather(
+            self._generate_primary_insights(transcript_with_emotions, transcript, candidate_name),
+            self._generate_emotional_analysis(transcript_with_emotions, transcript, candidate_name)
+        )
         
         # Step 3: Combine insights into a comprehensive package
         combined_insights = self._combine_insights(primary_insights, emotional_analysis)
@@ -653,25 +1109,17 @@ class AnalyticsProcessor:
             if "question_specific_insights" in emotional_analysis:
                 combined["question_specific_insights"] = emotional_analysis["question_specific_insights"]
             
-            # Merge strengths
-            if "strengths" in emotional_analysis:
-                if "strengths" not in combined:
-                    combined["strengths"] = []
-                
-                # Add unique strengths from emotional analysis
-                for strength in emotional_analysis.get("strengths", []):
-                    if strength not in combined["strengths"]:
-                        combined["strengths"].append(strength)
-            
-            # Merge development areas
-            if "development_areas" in emotional_analysis:
-                if "development_areas" not in combined:
-                    combined["development_areas"] = []
-                
-                # Add unique development areas from emotional analysis
-                for area in emotional_analysis.get("development_areas", []):
-                    if area not in combined["development_areas"]:
-                        combined["development_areas"].append(area)
+            # Merge strengths and development areas, adding only unique items
+            for key in ("strengths", "development_areas"):
+                if key in emotional_analysis:
+                    merged = list(combined.get(key, []))
+                    seen = {_dedupe_key(item) for item in merged}
+                    for item in emotional_analysis.get(key, []):
+                        item_key = _dedupe_key(item)
+                        if item_key not in seen:
+                            seen.add(item_key)
+                            merged.append(item)
+                    combined[key] = merged
             
             # Add word_emotion_correlations if available
             if "word_emotion_correlations" in emotional_analysis:
@@ -696,10 +1144,19 @@ class AnalyticsProcessor:
             emotion_frames = self._extract_emotion_frames_from_raw(analytics_data)
         
         # Process transcript with emotions if raw transcript is available
-        transcript_raw_path = os.path.join(os.path.dirname(analytics_data["result_path"]), "transcript_raw.json")
+        result_path = analytics_data["result_path"]
+        transcript_raw_path = os.path.join(os.path.dirname(result_path), "transcript_raw.json")
         transcript_with_emotions = []
         if os.path.exists(transcript_raw_path) and emotion_frames:
-            transcript_with_emotions = self._process_transcript_with_emotions(transcript_raw_path, emotion_frames)
+            # Reuse the segments while neither the results nor the transcript have changed
+            result_mtime = os.stat(result_path).st_mtime_ns if os.path.exists(result_path) else None
+            cache_key = (result_path, result_mtime, transcript_raw_path, os.stat(transcript_raw_path).st_mtime_ns)
+            cached = self._emotion_data_cache
+            if cached is not None and cached[0] == cache_key:
+                transcript_with_emotions = cached[1]
+            else:
+                transcript_with_emotions = self._process_transcript_with_emotions(transcript_raw_path, emotion_frames)
+                self._emotion_data_cache = (cache_key, transcript_with_emotions)
         
         return transcript_with_emotions
     
@@ -714,65 +1171,65 @@ class AnalyticsProcessor:
         Returns:
             list: List of relevant question-answer pairs with emotional data
         """
-        logger.info("Filtering relevant interview questions")
+        # Both analysis passes ask for the pairs of the same segments and transcript
+        cached = self._qa_pairs_cache
+        if cached is not None and cached[0] is transcript_with_emotions and cached[1] is full_transcript:
+            return cached[2]
         
-        # Extract lines from the full transcript
-        transcript_lines = full_transcript.split('\n')
+        logger.info("Filtering relevant interview questions")
         
         # Identify potential questions (lines ending with question marks or containing question indicators)
         questions = []
-        for i, line in enumerate(transcript_lines):
-            if '|' not in line:
-                continue
-                
+        line_index = 0
+        line_index_pos = 0
+        for match in _TRANSCRIPT_LINE_RE.finditer(full_transcript):
             # Extract speaker and text
-            parts = line.split('|', 1)
-            if len(parts) < 2:
-                continue
-                
-            speaker = parts[1].strip().split('\n')[0]
-            text = parts[1].strip()
+            text = match.group(2).strip()
+            speaker = text
             
             # Skip if the speaker is the candidate
             if "Daniel Kraft" in speaker:
                 continue
                 
             # Check if this is likely a question
-            is_question = ('?' in text or 
-                          any(q in text.lower() for q in [
-                              "tell me about", "what is", "how would", "describe", 
-                              "explain", "can you", "do you", "have you"
-                          ]))
+            is_question = _QUESTION_RE.search(text) is not None
             
             if is_question:
                 # Find the timestamp
-                timestamp = parts[0].strip() if parts[0].strip() else "00:00"
+                timestamp = match.group(1).strip() or "00:00"
                 
-                # Convert timestamp to seconds
-                try:
-                    minutes, seconds = timestamp.split(':')
-                    time_seconds = int(minutes) * 60 + int(seconds)
-                except:
-                    time_seconds = 0
+                # Line number of the question within the transcript
+                line_index += full_transcript.count('\n', line_index_pos, match.start())
+                line_index_pos = match.start()
                 
                 questions.append({
                     "timestamp": timestamp,
-                    "time_seconds": time_seconds,
+                    "time_seconds": 0,
                     "text": text,
-                    "index": i
+                    "index": line_index
                 })
         
+        # Convert all question timestamps to seconds in one pass
+        for question, time_seconds in zip(questions, _timestamps_to_seconds([q["timestamp"] for q in questions])):
+            question["time_seconds"] = time_seconds
+        
         # Filter out irrelevant questions (small talk, name queries, etc.)
-        irrelevant_patterns = [
-            "how are you", "nice to meet", "your name", "introduce yourself",
-            "weather", "doing today", "go for it", "pan", "testing", "hear me",
-            "can you see", "technical", "connection"
-        ]
+        relevant_questions = [q for q in questions if _IRRELEVANT_QUESTION_RE.search(q["text"]) is None]
         
-        relevant_questions = []
-        for q in questions:
-            if not any(pattern in q["text"].lower() for pattern in irrelevant_patterns):
-                relevant_questions.append(q)
+        # Segment start times in seconds, and the segment order sorted by them,
+        # so each question's response window is found by binary search
+        seg_starts = np.fromiter(
+            (_segment_start_seconds(segment["start"]) for segment in transcript_with_emotions),
+            dtype=np.float64, count=len(transcript_with_emotions)
+        )
+        seg_order = np.argsort(seg_starts, kind="stable")
+        sorted_starts = seg_starts[seg_order]
+        
+        # Peak emotion score of each segment, computed once rather than per comparison
+        seg_peaks = np.fromiter(
+            (max((segment.get("avg_emotions") or {}).values(), default=0.0) for segment in transcript_with_emotions),
+            dtype=np.float64, count=len(transcript_with_emotions)
+        )
         
         # Match questions with candidate responses in the transcript_with_emotions
         qa_pairs = []
@@ -781,25 +1238,15 @@ class AnalyticsProcessor:
             start_time = question["time_seconds"]
             end_time = relevant_questions[i+1]["time_seconds"] if i < len(relevant_questions) - 1 else float('inf')
             
-            # Find the response segments that fall within this time range
-            response_segments = []
-            for segment in transcript_with_emotions:
-                seg_start = segment["start"]
-                # Convert to seconds if it's not already
-                if isinstance(seg_start, float) and seg_start < 1000:  # Likely already in seconds
-                    pass
-                elif isinstance(seg_start, (int, float)):  # Likely in milliseconds
-                    seg_start = seg_start / 1000.0
-                
-                # Check if this segment falls within the expected response time range
-                if start_time <= seg_start and seg_start < end_time:
-                    response_segments.append(segment)
+            # Find the response segments that fall within this time range, in transcript order
+            lo, hi = sorted_starts.searchsorted([start_time, end_time], side="left")
+            response_indices = np.sort(seg_order[lo:hi])
+            response_segments = [transcript_with_emotions[j] for j in response_indices.tolist()]
             
             # If we found response segments, add this as a Q&A pair
             if response_segments:
                 # Find the segment with the strongest emotional response
-                strongest_segment = max(response_segments, 
-                                       key=lambda s: max(s.get("avg_emotions", {}).values()) if s.get("avg_emotions") else 0)
+                strongest_segment = response_segments[int(seg_peaks[response_indices].argmax())]
                 
                 qa_pairs.append({
                     "question": question["text"],
@@ -809,6 +1256,7 @@ class AnalyticsProcessor:
                 })
         
         logger.info(f"Identified {len(qa_pairs)} relevant question-answer pairs")
+        self._qa_pairs_cache = (transcript_with_emotions, full_transcript, qa_pairs)
         return qa_pairs
     
     async def _generate_primary_insights(self, analytics_data, transcript, candidate_name):
@@ -852,6 +1300,9 @@ Structure your response as a JSON object with the following sections:
 - recommendation: Clear hiring recommendation with rationale
 """
         
+        transcript_excerpt = transcript[:PROMPT_TRANSCRIPT_CHARS]
+        analytics_data_json = _prompt_json(analytics_data)
+        
         # Create user prompt for primary insights
         user_prompt = f"""
 Below is an interview transcript. Please analyze it following the guidelines above and provide actionable insights:
@@ -862,12 +1313,12 @@ Below is an interview transcript. Please analyze it following the guidelines abo
 
 ## Interview Transcript
 ```
-{transcript[:10000]}  # Limit transcript length for prompt
+{transcript_excerpt}  # Limit transcript length for prompt
 ```
 
 ## Hume AI Analytics Data
 ```json
-{json.dumps(analytics_data, indent=2)}
+{analytics_data_json}
 ```
 
 ## Task
@@ -923,8 +1374,8 @@ Format your response as a structured JSON object with the following keys:
 - recommendation
 """
         
-        # Call Claude 3.7 Sonnet API
-        response = self.anthropic_client.messages.create(
+        # Call Claude 3.7 Sonnet API without blocking the event loop
+        response = await self.anthropic_client.messages.create(
             model="claude-3-7-sonnet-20240229",
             max_tokens=4000,
             temperature=0.2,
@@ -961,31 +1412,33 @@ Format your response as a structured JSON object with the following keys:
         relevant_qa_pairs = self._filter_relevant_questions(transcript_with_emotions, transcript)
         
         # Step 2: Analyze emotional responses tied to specific words
-        word_emotion_analysis = self._analyze_word_emotions(relevant_qa_pairs)
+        word_emotion_analysis = self._analyze_word_emotions(relevant_qa_pairs) if relevant_qa_pairs else {}
         
         # Prepare emotion data for the user prompt
         emotion_analysis = ""
         if relevant_qa_pairs:
-            emotion_analysis = "## Key Interview Questions and Emotional Responses\n\n"
+            # Collect the prompt fragments and join them once at the end
+            parts = ["## Key Interview Questions and Emotional Responses\n\n"]
             for i, qa_pair in enumerate(relevant_qa_pairs):
-                emotion_analysis += f"### Question {i+1}: {qa_pair['question']}\n"
-                emotion_analysis += f"**Candidate Response:** {qa_pair['response']['transcript']}\n\n"
-                emotion_analysis += "**Emotions:**\n"
+                parts.append(f"### Question {i+1}: {qa_pair['question']}\n")
+                parts.append(f"**Candidate Response:** {qa_pair['response']['transcript']}\n\n")
+                parts.append("**Emotions:**\n")
                 
                 if qa_pair['response']['avg_emotions']:
                     # Sort emotions by score (highest first) and show top 8
-                    top_emotions = sorted(qa_pair['response']['avg_emotions'].items(), key=lambda x: x[1], reverse=True)[:8]
+                    top_emotions = nlargest(8, qa_pair['response']['avg_emotions'].items(), key=itemgetter(1))
                     for emotion, score in top_emotions:
-                        emotion_analysis += f"- {emotion}: {score:.2f}\n"
+                        parts.append(f"- {emotion}: {score:.2f}\n")
                 else:
-                    emotion_analysis += "- No emotion data available for this response.\n"
+                    parts.append("- No emotion data available for this response.\n")
                 
                 if 'key_phrases' in qa_pair and qa_pair['key_phrases']:
-                    emotion_analysis += "\n**Key Phrases and Associated Emotions:**\n"
+                    parts.append("\n**Key Phrases and Associated Emotions:**\n")
                     for phrase, emotions in qa_pair['key_phrases'].items():
-                        emotion_analysis += f"- \"{phrase}\": {', '.join([f'{e}: {s:.2f}' for e, s in emotions[:3]])}\n"
+                        parts.append(f"- \"{phrase}\": {', '.join([f'{e}: {s:.2f}' for e, s in emotions[:3]])}\n")
                 
-                emotion_analysis += "\n"
+                parts.append("\n")
+            emotion_analysis = "".join(parts)
         
         # Create system prompt for emotional analysis
         system_prompt = """You are an expert in analyzing emotional patterns in interview contexts.
@@ -1009,6 +1462,9 @@ Structure your analysis in JSON format with these fields:
 - development_areas: Array of development areas revealed by emotional patterns (ONLY based on topics actually discussed)
 """
 
+        transcript_excerpt = transcript[:PROMPT_TRANSCRIPT_CHARS]
+        word_emotion_analysis_json = _prompt_json(word_emotion_analysis)
+        
         # Create user prompt for emotional analysis
         user_prompt = f"""
 ## Candidate Information
@@ -1017,7 +1473,7 @@ Structure your analysis in JSON format with these fields:
 
 ## Interview Transcript
 ```
-{transcript[:10000]}  # Limit transcript length for prompt
+{transcript_excerpt}  # Limit transcript length for prompt
 ```
 
 ## Emotional Analysis Data
@@ -1027,7 +1483,7 @@ The following data shows the candidate's emotional responses to specific intervi
 
 ## Word-Emotion Correlations
 ```json
-{json.dumps(word_emotion_analysis, indent=2)}
+{word_emotion_analysis_json}
 ```
 
 ## Task
@@ -1060,4 +1516,18 @@ Please structure your response as a JSON object with the following keys:
 - strengths (array)
 - development_areas (array)
 """
+        
+        # Call Claude 3.7 Sonnet API without blocking the event loop
+        response = await self.anthropic_client.messages.create(
+            model="claude-3-7-sonnet-20240229",
+            max_tokens=4000,
+            temperature=0.2,
+            system=system_prompt.strip(),
+            messages=[
+                {"role": "user", "content": user_prompt.strip()}
+            ]
+        )
+        
+        # Parse structured emotional analysis from Claude's response
+        return self._parse_insights(response.content[0].text)
 {{ ... }}
\ No newline at end of file
@@ -4,11 +4,11 @@ This module provides a CLI for manually adding and joining meetings.
 """
 
 import os
+import re
 import sys
 import logging
 import getpass
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
 # Set up logging
 logging.basicConfig(
@@ -17,6 +17,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Answers accepted as confirmation
+_YES = frozenset({"y", "yes"})
+
+# Text fields of a meeting entry: (field, prompt, pattern the value must match,
+# error shown for a missing or invalid value; None if the field is optional)
+_MEETING_FIELDS = [
+    ("meeting_url", "Enter Zoom meeting URL: ", re.compile(r"zoom\.us"),
+     "Invalid Zoom meeting URL. It should contain 'zoom.us'."),
+    ("meeting_title", "Enter meeting title (optional): ", None, None),
+    ("organizer_email", "Enter organizer email: ", re.compile(r"@"), "Invalid email address."),
+    ("organizer_name", "Enter organizer name (optional): ", None, None),
+    ("organizer_company", "Enter organizer company (optional): ", None, None),
+    ("organizer_role", "Enter organizer role (optional): ", None, None),
+    ("candidate_name", "Enter candidate name: ", None, "Candidate name is required."),
+    ("position", "Enter position being interviewed for: ", None, "Position is required."),
+]
+
 def get_meeting_details():
     """
     Prompt the user for meeting details.
@@ -26,41 +43,14 @@ def get_meeting_details():
     """
     print("\n=== Manual Meeting Entry ===\n")
     
-    # Get meeting URL
-    meeting_url = input("Enter Zoom meeting URL: ").strip()
-    while not meeting_url or "zoom.us" not in meeting_url:
-        print("Invalid Zoom meeting URL. It should contain 'zoom.us'.")
-        meeting_url = input("Enter Zoom meeting URL: ").strip()
-    
-    # Get meeting title
-    meeting_title = input("Enter meeting title (optional): ").strip()
-    
-    # Get organizer email
-    organizer_email = input("Enter organizer email: ").strip()
-    while not organizer_email or "@" not in organizer_email:
-        print("Invalid email address.")
-        organizer_email = input("Enter organizer email: ").strip()
-    
-    # Get organizer name
-    organizer_name = input("Enter organizer name (optional): ").strip()
-    
-    # Get organizer company
-    organizer_company = input("Enter organizer company (optional): ").strip()
-    
-    # Get organizer role
-    organizer_role = input("Enter organizer role (optional): ").strip()
-    
-    # Get candidate name
-    candidate_name = input("Enter candidate name: ").strip()
-    while not candidate_name:
-        print("Candidate name is required.")
-        candidate_name = input("Enter candidate name: ").strip()
-    
-    # Get position
-    position = input("Enter position being interviewed for: ").strip()
-    while not position:
-        print("Position is required.")
-        position = input("Enter position being interviewed for: ").strip()
+    # Prompt for each text field, re-prompting until required fields are valid
+    details = {}
+    for field, prompt, pattern, error in _MEETING_FIELDS:
+        value = input(prompt).strip()
+        while error and (not value or (pattern and not pattern.search(value))):
+            print(error)
+            value = input(prompt).strip()
+        details[field] = value
     
     # Get scheduled time
     scheduled_time_str = input("Enter scheduled time (YYYY-MM-DD HH:MM, leave blank for now): ").strip()
@@ -75,21 +65,12 @@ def get_meeting_details():
     
     # Ask if the meeting should be joined immediately
     join_now_str = input("Join meeting immediately? (y/n): ").strip().lower()
-    join_now = join_now_str == "y" or join_now_str == "yes"
+    join_now = join_now_str in _YES
     
     # Return the meeting details
-    return {
-        "meeting_url": meeting_url,
-        "meeting_title": meeting_title,
-        "organizer_email": organizer_email,
-        "organizer_name": organizer_name,
-        "organizer_company": organizer_company,
-        "organizer_role": organizer_role,
-        "candidate_name": candidate_name,
-        "position": position,
-        "scheduled_time": scheduled_time,
-        "join_now": join_now
-    }
+    details["scheduled_time"] = scheduled_time
+    details["join_now"] = join_now
+    return details
 
 def run_manual_mode(db_manager, scheduler):
     """
@@ -106,29 +87,32 @@ def run_manual_mode(db_manager, scheduler):
         # Get meeting details from the user
         meeting_details = get_meeting_details()
         
-        # Add or get the organizer
-        organizer_id = db_manager.add_user(
-            email=meeting_details["organizer_email"],
-            name=meeting_details["organizer_name"],
-            company=meeting_details["organizer_company"],
-            role=meeting_details["organizer_role"]
-        )
-        
-        # Add the meeting to the database
-        meeting_id = db_manager.add_meeting(
-            url=meeting_details["meeting_url"],
-            title=meeting_details["meeting_title"] or f"Interview with {meeting_details['candidate_name']}",
-            organizer_id=organizer_id,
-            scheduled_time=meeting_details["scheduled_time"].isoformat(),
-            candidate_name=meeting_details["candidate_name"],
-            position=meeting_details["position"],
-            status="scheduled"
-        )
-        
-        # Add the organizer as a participant
-        db_manager.add_meeting_participant(meeting_id, organizer_id, "interviewer")
+        # Store the organizer, meeting and participant in a single transaction
+        with db_manager.transaction():
+            # Add or get the organizer
+            organizer_id = db_manager.add_user(
+                email=meeting_details["organizer_email"],
+                name=meeting_details["organizer_name"],
+                company=meeting_details["organizer_company"],
+                role=meeting_details["organizer_role"]
+            )
+            organizer_hash_key = db_manager.get_user(user_id=organizer_id)["hash_key"]
+            
+            # Add the meeting to the database
+            meeting_id = db_manager.add_meeting(
+                user_hash_key=organizer_hash_key,
+                url=meeting_details["meeting_url"],
+                title=meeting_details["meeting_title"] or f"Interview with {meeting_details['candidate_name']}",
+                scheduled_time=meeting_details["scheduled_time"].isoformat(),
+                candidate_name=meeting_details["candidate_name"],
+                position=meeting_details["position"],
+                status="scheduled"
+            )
+            
+            # Add the organizer as a participant
+            db_manager.add_meeting_participant(meeting_id, organizer_hash_key, "interviewer")
         
-        logger.info(f"Meeting added with ID: {meeting_id}")
+        logger.info("Meeting added with ID: %s", meeting_id)
         
         # Join the meeting immediately or schedule it
         if meeting_details["join_now"]:
@@ -141,7 +125,7 @@ def run_manual_mode(db_manager, scheduler):
                 logger.error("Failed to join meeting")
                 return False
         else:
-            logger.info(f"Scheduling meeting for {meeting_details['scheduled_time']}...")
+            logger.info("Scheduling meeting for %s...", meeting_details['scheduled_time'])
             result = scheduler.schedule_meeting(meeting_id)
             if result:
                 logger.info("Meeting scheduled successfully")
@@ -151,11 +135,12 @@ def run_manual_mode(db_manager, scheduler):
                 return False
         
     except Exception as e:
-        logger.error(f"Error in manual mode: {str(e)}")
+        logger.error("Error in manual mode: %s", e, exc_info=True)
         return False
 
 if __name__ == "__main__":
     # This is just for testing the module directly
+    from dotenv import load_dotenv
     from src.database.manager import DatabaseManager
     from src.zoom_bot.scheduler import ZoomBotScheduler
     
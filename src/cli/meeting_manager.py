@@ -4,12 +4,25 @@ This module provides a CLI for listing, viewing, and managing meetings.
 """
 
 import os
+import re
 import sys
 import logging
 import json
 from datetime import datetime
-from tabulate import tabulate
-from dotenv import load_dotenv
+from functools import lru_cache
+
+# orjson is optional; without it analysis results are formatted with the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ciso8601 is optional; without it timestamps are parsed with datetime.fromisoformat
+try:
+    from ciso8601 import parse_datetime as _parse_datetime
+except ImportError:
+    _parse_datetime = datetime.fromisoformat
 
 # Set up logging
 logging.basicConfig(
@@ -18,10 +31,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# ISO-8601 timestamps as stored by the database, e.g. 2025-03-13T23:02:37.123456
+_ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?")
+
+# Answers accepted as confirmation
+_YES = frozenset({"y", "yes"})
+
+# Meeting statuses offered by the update menu, by menu number
+_STATUS_MAP = {
+    "1": "scheduled",
+    "2": "joining",
+    "3": "recording",
+    "4": "completed",
+    "5": "failed"
+}
+
+def _na(value):
+    """Return the value for display, or "N/A" if it is empty."""
+    return value if value else "N/A"
+
+@lru_cache(maxsize=4096)
 def format_datetime(dt_str):
     """
     Format a datetime string for display.
     
+    Results are cached, since listings repeat the same timestamps.
+    
     Args:
         dt_str (str): The datetime string in ISO format.
     
@@ -31,12 +66,108 @@ def format_datetime(dt_str):
     if not dt_str:
         return "N/A"
     
+    # ISO timestamps already hold the display fields, so slice them out
+    if isinstance(dt_str, str) and _ISO_DATETIME_RE.fullmatch(dt_str):
+        return f"{dt_str[:10]} {dt_str[11:19]}"
+    
     try:
-        dt = datetime.fromisoformat(dt_str)
+        dt = _parse_datetime(dt_str)
         return dt.strftime("%Y-%m-%d %H:%M:%S")
     except:
         return dt_str
 
+def _render_grid(headers, rows):
+    """
+    Render rows as a grid table, in the same layout as tabulate's "grid" format.
+    
+    Columns are at least two characters wider than their header. Columns
+    holding only integers are right-aligned, all others left-aligned.
+    
+    Args:
+        headers (list): The column headers.
+        rows (list): The table rows, each a list with one value per column.
+    
+    Returns:
+        str: The rendered table.
+    """
+    cells = [[str(value) for value in row] for row in rows]
+    widths = [max(len(header) + 2, *(len(row[i]) for row in cells)) for i, header in enumerate(headers)]
+    right_aligned = [
+        all(isinstance(row[i], int) and not isinstance(row[i], bool) for row in rows)
+        for i in range(len(headers))
+    ]
+    
+    def render_row(values):
+        return "| " + " | ".join(
+            value.rjust(width) if right else value.ljust(width)
+            for value, width, right in zip(values, widths, right_aligned)
+        ) + " |"
+    
+    separator = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    lines = [separator, render_row(headers), separator.replace("-", "=")]
+    for row in cells:
+        lines.append(render_row(row))
+        lines.append(separator)
+    return "\n".join(lines)
+
+@lru_cache(maxsize=256)
+def _pretty_json(json_str):
+    """
+    Re-indent a JSON string for display.
+    
+    Results are cached, since analysis results often repeat the same payloads.
+    
+    Args:
+        json_str (str): The JSON string.
+    
+    Returns:
+        str: The JSON indented by two spaces.
+    
+    Raises:
+        ValueError: If the string is not valid JSON.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(orjson.loads(json_str), option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(json.loads(json_str), indent=2)
+
+@lru_cache(maxsize=8)
+def _meeting_list_table(db_manager, status, limit, etag):
+    """
+    Fetch meetings and render them as a table.
+    
+    Results are cached by the meetings etag, so showing the same list again
+    skips both the query and the rendering until the meetings change. The
+    functions in this module that write meetings clear the cache.
+    
+    Args:
+        db_manager: The database manager instance.
+        status (str): Filter meetings by status, or None for all meetings.
+        limit (int): Maximum number of meetings to list.
+        etag (tuple): Cache key identifying the current state of the meetings.
+    
+    Returns:
+        str or None: The rendered table, or None if there are no meetings.
+    """
+    # Get meetings from the database
+    meetings = db_manager.get_meetings(status=status, limit=limit)
+    
+    # Prepare table headers and rows
+    headers = ["ID", "Title", "Candidate", "Position", "Scheduled Time", "Status"]
+    fmt = format_datetime
+    rows = [
+        [
+            meeting["id"],
+            _na(meeting["title"]),
+            _na(meeting["candidate_name"]),
+            _na(meeting["position"]),
+            fmt(meeting["scheduled_time"]),
+            _na(meeting["status"])
+        ]
+        for meeting in meetings
+    ]
+    
+    return _render_grid(headers, rows) if rows else None
+
 def list_meetings(db_manager, status=None, limit=10):
     """
     List meetings in the database.
@@ -50,36 +181,22 @@ def list_meetings(db_manager, status=None, limit=10):
         bool: True if the operation was successful, False otherwise.
     """
     try:
-        # Get meetings from the database
-        meetings = db_manager.get_meetings(status=status, limit=limit)
+        # The etag changes after every commit, including other processes'
+        table = _meeting_list_table(db_manager, status, limit, db_manager.get_meetings_etag())
         
-        if not meetings:
+        if table is None:
             print("No meetings found.")
             return True
         
-        # Prepare table headers and rows
-        headers = ["ID", "Title", "Candidate", "Position", "Scheduled Time", "Status"]
-        rows = []
-        
-        for meeting in meetings:
-            rows.append([
-                meeting["id"],
-                meeting["title"] or "N/A",
-                meeting["candidate_name"] or "N/A",
-                meeting["position"] or "N/A",
-                format_datetime(meeting["scheduled_time"]),
-                meeting["status"] or "N/A"
-            ])
-        
         # Print the table
         print("\n=== Meetings ===\n")
-        print(tabulate(rows, headers=headers, tablefmt="grid"))
+        print(table)
         print()
         
         return True
         
     except Exception as e:
-        logger.error(f"Error listing meetings: {str(e)}")
+        logger.error("Error listing meetings: %s", e, exc_info=True)
         return False
 
 def view_meeting(db_manager, meeting_id):
@@ -94,95 +211,96 @@ def view_meeting(db_manager, meeting_id):
         bool: True if the operation was successful, False otherwise.
     """
     try:
-        # Get the meeting from the database
-        meeting = db_manager.get_meeting(meeting_id)
+        # Get the meeting with its organizer, participants and analysis results
+        details = db_manager.get_meeting_full(meeting_id)
         
-        if not meeting:
+        if not details:
             print(f"Meeting with ID {meeting_id} not found.")
             return False
         
-        # Get the organizer
-        organizer = db_manager.get_user(meeting["organizer_id"]) if meeting["organizer_id"] else None
-        
-        # Get meeting participants
-        participants = db_manager.get_meeting_participants(meeting_id)
+        meeting = details["meeting"]
+        organizer = details["organizer"]
+        participants = details["participants"]
+        analysis_results = details["analysis_results"]
         
-        # Get analysis results
-        analysis_results = db_manager.get_analysis_results(meeting_id)
+        # Collect the output and write it in one go
+        out = []
         
-        # Print meeting details
-        print("\n=== Meeting Details ===\n")
-        print(f"ID: {meeting['id']}")
-        print(f"Title: {meeting['title'] or 'N/A'}")
-        print(f"URL: {meeting['url'] or 'N/A'}")
-        print(f"Candidate: {meeting['candidate_name'] or 'N/A'}")
-        print(f"Position: {meeting['position'] or 'N/A'}")
-        print(f"Scheduled Time: {format_datetime(meeting['scheduled_time'])}")
-        print(f"Start Time: {format_datetime(meeting['start_time'])}")
-        print(f"End Time: {format_datetime(meeting['end_time'])}")
-        print(f"Status: {meeting['status'] or 'N/A'}")
-        print(f"Bot ID: {meeting['bot_id'] or 'N/A'}")
+        # Meeting details
+        out.append("\n=== Meeting Details ===\n")
+        out.append(f"ID: {meeting['id']}")
+        out.append(f"Title: {_na(meeting['title'])}")
+        out.append(f"URL: {_na(meeting['url'])}")
+        out.append(f"Candidate: {_na(meeting['candidate_name'])}")
+        out.append(f"Position: {_na(meeting['position'])}")
+        out.append(f"Scheduled Time: {format_datetime(meeting['scheduled_time'])}")
+        out.append(f"Start Time: {format_datetime(meeting['start_time'])}")
+        out.append(f"End Time: {format_datetime(meeting['end_time'])}")
+        out.append(f"Status: {_na(meeting['status'])}")
+        out.append(f"Bot ID: {_na(meeting['bot_id'])}")
         
-        # Print organizer details
-        print("\n=== Organizer ===\n")
+        # Organizer details
+        out.append("\n=== Organizer ===\n")
         if organizer:
-            print(f"Name: {organizer['name'] or 'N/A'}")
-            print(f"Email: {organizer['email'] or 'N/A'}")
-            print(f"Company: {organizer['company'] or 'N/A'}")
-            print(f"Role: {organizer['role'] or 'N/A'}")
+            out.append(f"Name: {_na(organizer['name'])}")
+            out.append(f"Email: {_na(organizer['email'])}")
+            out.append(f"Company: {_na(organizer['company'])}")
+            out.append(f"Role: {_na(organizer['role'])}")
         else:
-            print("No organizer information available.")
+            out.append("No organizer information available.")
         
-        # Print participants
-        print("\n=== Participants ===\n")
+        # Participants
+        out.append("\n=== Participants ===\n")
         if participants:
             headers = ["Name", "Email", "Company", "Role", "Participant Role"]
             rows = []
             
             for participant in participants:
                 rows.append([
-                    participant["name"] or "N/A",
-                    participant["email"] or "N/A",
-                    participant["company"] or "N/A",
-                    participant["role"] or "N/A",
-                    participant["participant_role"] or "N/A"
+                    _na(participant["name"]),
+                    _na(participant["email"]),
+                    _na(participant["company"]),
+                    _na(participant["role"]),
+                    _na(participant["participant_role"])
                 ])
             
-            print(tabulate(rows, headers=headers, tablefmt="grid"))
+            out.append(_render_grid(headers, rows))
         else:
-            print("No participants found.")
+            out.append("No participants found.")
         
-        # Print file paths
-        print("\n=== Files ===\n")
-        print(f"Recording: {meeting['recording_path'] or 'N/A'}")
-        print(f"Transcript: {meeting['transcript_path'] or 'N/A'}")
-        print(f"Analytics: {meeting['analytics_path'] or 'N/A'}")
-        print(f"Insights: {meeting['insights_path'] or 'N/A'}")
-        print(f"Report: {meeting['report_path'] or 'N/A'}")
+        # File paths
+        out.append("\n=== Files ===\n")
+        out.append(f"Recording: {_na(meeting['recording_path'])}")
+        out.append(f"Transcript: {_na(meeting['transcript_path'])}")
+        out.append(f"Analytics: {_na(meeting['analytics_path'])}")
+        out.append(f"Insights: {_na(meeting['insights_path'])}")
+        out.append(f"Report: {_na(meeting['report_path'])}")
         
-        # Print analysis results
-        print("\n=== Analysis Results ===\n")
+        # Analysis results
+        out.append("\n=== Analysis Results ===\n")
         if analysis_results:
             for result in analysis_results:
-                print(f"Type: {result['result_type'] or 'N/A'}")
-                print(f"Created At: {format_datetime(result['created_at'])}")
+                out.append(f"Type: {_na(result['result_type'])}")
+                out.append(f"Created At: {format_datetime(result['created_at'])}")
                 
                 # Try to pretty-print the JSON data
                 try:
-                    data = json.loads(result["result_data"])
-                    print("Data:")
-                    print(json.dumps(data, indent=2))
-                except:
-                    print(f"Data: {result['result_data'] or 'N/A'}")
+                    pretty_data = _pretty_json(result["result_data"])
+                    out.append("Data:")
+                    out.append(pretty_data)
+                except (TypeError, ValueError):
+                    out.append(f"Data: {_na(result['result_data'])}")
                 
-                print()
+                out.append("")
         else:
-            print("No analysis results found.")
+            out.append("No analysis results found.")
+        
+        sys.stdout.write("\n".join(out) + "\n")
         
         return True
         
     except Exception as e:
-        logger.error(f"Error viewing meeting: {str(e)}")
+        logger.error("Error viewing meeting: %s", e, exc_info=True)
         return False
 
 def update_meeting_status(db_manager, meeting_id, status):
@@ -198,21 +316,18 @@ def update_meeting_status(db_manager, meeting_id, status):
         bool: True if the operation was successful, False otherwise.
     """
     try:
-        # Get the meeting from the database
-        meeting = db_manager.get_meeting(meeting_id)
-        
-        if not meeting:
+        # Update the meeting status, which also tells us whether the meeting exists
+        updated = db_manager.update_meeting_status_checked(meeting_id, status)
+        _meeting_list_table.cache_clear()
+        if not updated:
             print(f"Meeting with ID {meeting_id} not found.")
             return False
         
-        # Update the meeting status
-        db_manager.update_meeting(meeting_id, status=status)
-        
         print(f"Meeting status updated to '{status}'.")
         return True
         
     except Exception as e:
-        logger.error(f"Error updating meeting status: {str(e)}")
+        logger.error("Error updating meeting status: %s", e, exc_info=True)
         return False
 
 def delete_meeting(db_manager, meeting_id):
@@ -237,20 +352,74 @@ def delete_meeting(db_manager, meeting_id):
         # Confirm deletion
         confirm = input(f"Are you sure you want to delete meeting '{meeting['title']}' (ID: {meeting_id})? (y/n): ").strip().lower()
         
-        if confirm != "y" and confirm != "yes":
+        if confirm not in _YES:
             print("Deletion cancelled.")
             return False
         
         # Delete the meeting
         db_manager.delete_meeting(meeting_id)
+        _meeting_list_table.cache_clear()
         
         print(f"Meeting with ID {meeting_id} deleted.")
         return True
         
     except Exception as e:
-        logger.error(f"Error deleting meeting: {str(e)}")
+        logger.error("Error deleting meeting: %s", e, exc_info=True)
         return False
 
+def _read_meeting_id():
+    """
+    Prompt the user for a meeting ID.
+    
+    Returns:
+        int or None: The meeting ID, or None if the input was not a number.
+    """
+    meeting_id = input("Enter meeting ID: ").strip()
+    try:
+        return int(meeting_id)
+    except ValueError:
+        print("Invalid meeting ID. Please enter a number.")
+        return None
+
+def _prompt_view_meeting(db_manager):
+    """Prompt for a meeting ID and view that meeting."""
+    meeting_id = _read_meeting_id()
+    if meeting_id is not None:
+        view_meeting(db_manager, meeting_id)
+
+def _prompt_update_meeting_status(db_manager):
+    """Prompt for a meeting ID and a new status, and update the meeting."""
+    meeting_id = _read_meeting_id()
+    if meeting_id is None:
+        return
+    
+    print("\nAvailable statuses:")
+    for number, status in _STATUS_MAP.items():
+        print(f"{number}. {status}")
+    
+    status_choice = input("Enter status number: ").strip()
+    
+    if status_choice in _STATUS_MAP:
+        update_meeting_status(db_manager, meeting_id, _STATUS_MAP[status_choice])
+    else:
+        print("Invalid status choice.")
+
+def _prompt_delete_meeting(db_manager):
+    """Prompt for a meeting ID and delete that meeting."""
+    meeting_id = _read_meeting_id()
+    if meeting_id is not None:
+        delete_meeting(db_manager, meeting_id)
+
+# Meeting manager menu actions, by menu choice
+_MENU_ACTIONS = {
+    "1": list_meetings,
+    "2": lambda db_manager: list_meetings(db_manager, status="scheduled"),
+    "3": lambda db_manager: list_meetings(db_manager, status="completed"),
+    "4": _prompt_view_meeting,
+    "5": _prompt_update_meeting_status,
+    "6": _prompt_delete_meeting
+}
+
 def run_meeting_manager(db_manager):
     """
     Run the meeting manager CLI.
@@ -277,72 +446,21 @@ def run_meeting_manager(db_manager):
             if choice == "0":
                 break
             
-            elif choice == "1":
-                list_meetings(db_manager)
-            
-            elif choice == "2":
-                list_meetings(db_manager, status="scheduled")
-            
-            elif choice == "3":
-                list_meetings(db_manager, status="completed")
-            
-            elif choice == "4":
-                meeting_id = input("Enter meeting ID: ").strip()
-                try:
-                    meeting_id = int(meeting_id)
-                    view_meeting(db_manager, meeting_id)
-                except ValueError:
-                    print("Invalid meeting ID. Please enter a number.")
-            
-            elif choice == "5":
-                meeting_id = input("Enter meeting ID: ").strip()
-                try:
-                    meeting_id = int(meeting_id)
-                    
-                    print("\nAvailable statuses:")
-                    print("1. scheduled")
-                    print("2. joining")
-                    print("3. recording")
-                    print("4. completed")
-                    print("5. failed")
-                    
-                    status_choice = input("Enter status number: ").strip()
-                    
-                    status_map = {
-                        "1": "scheduled",
-                        "2": "joining",
-                        "3": "recording",
-                        "4": "completed",
-                        "5": "failed"
-                    }
-                    
-                    if status_choice in status_map:
-                        update_meeting_status(db_manager, meeting_id, status_map[status_choice])
-                    else:
-                        print("Invalid status choice.")
-                
-                except ValueError:
-                    print("Invalid meeting ID. Please enter a number.")
-            
-            elif choice == "6":
-                meeting_id = input("Enter meeting ID: ").strip()
-                try:
-                    meeting_id = int(meeting_id)
-                    delete_meeting(db_manager, meeting_id)
-                except ValueError:
-                    print("Invalid meeting ID. Please enter a number.")
-            
+            action = _MENU_ACTIONS.get(choice)
+            if action:
+                action(db_manager)
             else:
                 print("Invalid choice. Please try again.")
         
         return True
         
     except Exception as e:
-        logger.error(f"Error in meeting manager: {str(e)}")
+        logger.error("Error in meeting manager: %s", e, exc_info=True)
         return False
 
 if __name__ == "__main__":
     # This is just for testing the module directly
+    from dotenv import load_dotenv
     from src.database.manager import DatabaseManager
     
     # Load environment variables
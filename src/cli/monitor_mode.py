@@ -7,9 +7,8 @@ import os
 import sys
 import logging
 import getpass
-import time
 import signal
-from dotenv import load_dotenv
+import threading
 
 # Set up logging
 logging.basicConfig(
@@ -18,16 +17,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Flag to indicate whether the monitoring should continue
-keep_monitoring = True
+# Set when the monitoring should stop
+_stop_event = threading.Event()
 
 def signal_handler(sig, frame):
     """
     Handle Ctrl+C to gracefully stop the monitoring.
     """
-    global keep_monitoring
     logger.info("Stopping email monitoring...")
-    keep_monitoring = False
+    _stop_event.set()
 
 def get_email_credentials():
     """
@@ -37,9 +35,8 @@ def get_email_credentials():
         tuple: A tuple containing the email address, password, and IMAP server.
     """
     # Get email credentials from environment variables
-    email_address = os.environ.get('EMAIL_ADDRESS')
-    password = os.environ.get('EMAIL_PASSWORD')
-    imap_server = os.environ.get('EMAIL_IMAP_SERVER')
+    env = os.environ
+    email_address, password, imap_server = env.get('EMAIL_ADDRESS'), env.get('EMAIL_PASSWORD'), env.get('EMAIL_IMAP_SERVER')
     
     # If any credential is missing, prompt the user
     if not email_address:
@@ -69,20 +66,21 @@ def get_gmail_api_credentials():
     Returns:
         dict or None: A dictionary containing the Gmail API credentials if available, None otherwise.
     """
-    client_id = os.environ.get('GMAIL_API_CLIENT_ID')
-    client_secret = os.environ.get('GMAIL_API_CLIENT_SECRET')
-    refresh_token = os.environ.get('GMAIL_API_REFRESH_TOKEN')
-    
-    if client_id and client_secret and refresh_token:
-        logger.info("Gmail API credentials found in environment variables")
-        return {
-            'client_id': client_id,
-            'client_secret': client_secret,
-            'refresh_token': refresh_token
-        }
-    
-    logger.info("Gmail API credentials not found in environment variables")
-    return None
+    env = os.environ
+    client_id, client_secret, refresh_token = (
+        env.get('GMAIL_API_CLIENT_ID'), env.get('GMAIL_API_CLIENT_SECRET'), env.get('GMAIL_API_REFRESH_TOKEN')
+    )
+    
+    if not (client_id and client_secret and refresh_token):
+        logger.info("Gmail API credentials not found in environment variables")
+        return None
+    
+    logger.info("Gmail API credentials found in environment variables")
+    return {
+        'client_id': client_id,
+        'client_secret': client_secret,
+        'refresh_token': refresh_token
+    }
 
 def run_monitor_mode(db_manager, scheduler, email_monitor=None):
     """
@@ -96,12 +94,11 @@ def run_monitor_mode(db_manager, scheduler, email_monitor=None):
     Returns:
         bool: True if the operation was successful, False otherwise.
     """
-    global keep_monitoring
+    # Set up signal handler for Ctrl+C, restoring the previous one when done
+    _stop_event.clear()
+    previous_handler = signal.signal(signal.SIGINT, signal_handler)
     
     try:
-        # Set up signal handler for Ctrl+C
-        signal.signal(signal.SIGINT, signal_handler)
-        
         # If no email monitor is provided, create one
         if email_monitor is None:
             # Get email credentials
@@ -142,9 +139,8 @@ def run_monitor_mode(db_manager, scheduler, email_monitor=None):
         print(f"Monitoring {email_monitor.email_address} for Zoom meeting invitations.")
         print("Press Ctrl+C to stop monitoring.")
         
-        # Keep the main thread running until Ctrl+C is pressed
-        while keep_monitoring:
-            time.sleep(1)
+        # Block the main thread until Ctrl+C is pressed
+        _stop_event.wait()
         
         # Stop the email monitor
         email_monitor.stop()
@@ -153,12 +149,16 @@ def run_monitor_mode(db_manager, scheduler, email_monitor=None):
         return True
         
     except Exception as e:
-        logger.error(f"Error running monitor mode: {str(e)}")
+        logger.error("Error running monitor mode: %s", e, exc_info=True)
         print(f"\nError: {str(e)}")
         return False
+    
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
 
 if __name__ == "__main__":
     # This is just for testing the module directly
+    from dotenv import load_dotenv
     from src.database.manager import DatabaseManager
     from src.zoom_bot.scheduler import ZoomBotScheduler
     
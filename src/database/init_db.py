@@ -6,6 +6,7 @@ This script initializes the database with the schema and optional test data.
 import os
 import argparse
 import logging
+import sqlite3
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -45,41 +46,57 @@ def initialize_database(db_path=None, add_test_data=False):
         logger.error("Failed to create database schema")
         return False
     
+    # Switch the database to write-ahead logging; the journal mode is stored in
+    # the database file, so every later connection uses it too
+    try:
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        logger.warning("Could not enable WAL journal mode: %s", e)
+    
     # Add test data if requested
     if add_test_data:
         try:
             # Create a database manager instance
             db_manager = DatabaseManager(db_path)
             
-            # Add test users
-            user1_id = db_manager.add_user(
-                email="interviewer@example.com",
-                name="John Smith",
-                company="Example Corp",
-                role="HR Manager"
-            )
-            
-            user2_id = db_manager.add_user(
-                email="candidate@example.com",
-                name="Jane Doe",
-                company="Job Seeker",
-                role="Software Engineer"
-            )
-            
-            # Add a test meeting
-            meeting_id = db_manager.add_meeting(
-                url="https://zoom.us/j/1234567890?pwd=abcdef",
-                title="Interview with Jane Doe",
-                organizer_id=user1_id,
-                scheduled_time="2023-12-31 10:00:00",
-                candidate_name="Jane Doe",
-                position="Software Engineer",
-                status="scheduled"
-            )
-            
-            # Add meeting participants
-            db_manager.add_meeting_participant(meeting_id, user1_id, "interviewer")
-            db_manager.add_meeting_participant(meeting_id, user2_id, "candidate")
+            # Add all test data in a single transaction
+            with db_manager.transaction():
+                # Add test users
+                user1_id = db_manager.add_user(
+                    email="interviewer@example.com",
+                    name="John Smith",
+                    company="Example Corp",
+                    role="HR Manager"
+                )
+                
+                user2_id = db_manager.add_user(
+                    email="candidate@example.com",
+                    name="Jane Doe",
+                    company="Job Seeker",
+                    role="Software Engineer"
+                )
+                
+                user1_hash_key = db_manager.get_user(user_id=user1_id)["hash_key"]
+                user2_hash_key = db_manager.get_user(user_id=user2_id)["hash_key"]
+                
+                # Add a test meeting
+                meeting_id = db_manager.add_meeting(
+                    user_hash_key=user1_hash_key,
+                    url="https://zoom.us/j/1234567890?pwd=abcdef",
+                    title="Interview with Jane Doe",
+                    scheduled_time="2023-12-31 10:00:00",
+                    candidate_name="Jane Doe",
+                    position="Software Engineer",
+                    status="scheduled"
+                )
+                
+                # Add meeting participants
+                db_manager.add_meeting_participant(meeting_id, user1_hash_key, "interviewer")
+                db_manager.add_meeting_participant(meeting_id, user2_hash_key, "candidate")
             
             logger.info("Test data added successfully")
             return True
@@ -7,31 +7,162 @@ meeting details, and analysis results.
 
 import os
 import logging
+import queue
+import random
 import sqlite3
 import json
 import time
 import threading
-import hashlib
+import secrets
 import uuid
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple, Union
+
+# orjson is optional; without it analysis results are serialized with the json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Page cache size per connection; negative values are in KiB (64 MiB)
+CACHE_SIZE_KIB = -65536
+# Bytes of the database file to memory-map (256 MiB)
+MMAP_SIZE = 268435456
+# Milliseconds SQLite waits on a locked database before giving up
+BUSY_TIMEOUT_MS = 20000
+# Idle read-only connections kept open for reuse
+READ_POOL_SIZE = 8
+# Rows read per query by the iter_* methods, which hold no connection between batches
+READ_BATCH_SIZE = 256
+
+# INSERT ... RETURNING needs SQLite 3.35 or newer
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Columns of the users table, in schema order
+_USER_COLUMNS = (
+    'id', 'email', 'hash_key', 'name', 'company', 'role', 'api_key',
+    'onboarded_at', 'created_at', 'last_login', 'updated_at'
+)
+# User lookup queries by column; a LIMIT of -1 means no limit
+_SELECT_USER_SQL = {
+    column: f"SELECT {', '.join(_USER_COLUMNS)} FROM users WHERE {column} = ? LIMIT ?"
+    for column in ('id', 'email', 'hash_key')
+}
+
+def _dump_json(data) -> str:
+    """Serialize analysis result data for storage.
+    
+    Args:
+        data: JSON-serializable data
+        
+    Returns:
+        str: Compact JSON text
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(data)
+
+def _load_json(text: str):
+    """Parse stored analysis result data.
+    
+    Args:
+        text: JSON text
+        
+    Returns:
+        The parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+class Meeting(NamedTuple):
+    """A row of the meetings table; use _asdict() for a dictionary."""
+    id: int
+    user_hash_key: str
+    url: str
+    title: Optional[str]
+    meeting_id: Optional[str]
+    password: Optional[str]
+    scheduled_time: Optional[str]
+    start_time: Optional[str]
+    end_time: Optional[str]
+    actual_start_time: Optional[str]
+    actual_end_time: Optional[str]
+    candidate_name: Optional[str]
+    position: Optional[str]
+    status: Optional[str]
+    bot_id: Optional[str]
+    recording_path: Optional[str]
+    transcript_path: Optional[str]
+    analytics_path: Optional[str]
+    insights_path: Optional[str]
+    report_path: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+
+class AnalysisResult(NamedTuple):
+    """A row of the analysis_results table, with result_data parsed from JSON."""
+    id: int
+    meeting_id: int
+    result_type: str
+    result_data: Any
+    created_at: Optional[str]
+
+# Column lists matching the field order of the row types
+_MEETING_COLUMNS = ", ".join(Meeting._fields)
+_ANALYSIS_RESULT_COLUMNS = ", ".join(AnalysisResult._fields)
+
+# Columns that update_meeting and update_user may change
+_MEETING_UPDATE_FIELDS = frozenset({
+    'url', 'title', 'meeting_id', 'password',
+    'scheduled_time', 'start_time', 'end_time',
+    'actual_start_time', 'actual_end_time',
+    'candidate_name', 'position', 'status', 'bot_id',
+    'recording_path', 'transcript_path', 'analytics_path',
+    'insights_path', 'report_path'
+})
+_USER_UPDATE_FIELDS = frozenset({'email', 'name', 'company', 'role', 'api_key', 'onboarded_at', 'last_login'})
+
+@lru_cache(maxsize=128)
+def _update_sql(table: str, key_column: str, fields: Tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a set of fields, which also bumps updated_at.
+    
+    Args:
+        table: Table to update
+        key_column: Column identifying the row to update
+        fields: Names of the columns to set, in parameter order, followed
+            by the updated_at value and the key
+        
+    Returns:
+        str: Parameterized SQL statement
+    """
+    assignments = "".join(f"{field} = ?, " for field in fields)
+    return f"UPDATE {table} SET {assignments}updated_at = ? WHERE {key_column} = ?"
+
 class DatabaseManager:
     """Manages database operations for the Zoom Interview Analysis System."""
     
-    _instance = None
+    # One instance per database file, keyed by its absolute path
+    _instances = {}
     _lock = threading.RLock()
     
     def __new__(cls, config_or_path: Union[object, str]):
-        """Implement singleton pattern to ensure only one DatabaseManager instance exists."""
+        """Share one DatabaseManager instance per database file."""
+        db_path = config_or_path if isinstance(config_or_path, str) else config_or_path.database_path
+        key = db_path if db_path == ":memory:" else os.path.abspath(db_path)
         with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(DatabaseManager, cls).__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = super(DatabaseManager, cls).__new__(cls)
+                instance._initialized = False
+                cls._instances[key] = instance
+            return instance
     
     def __init__(self, config_or_path: Union[object, str]):
         """Initialize the database manager.
@@ -40,9 +171,19 @@ class DatabaseManager:
             config_or_path: Either an application configuration object or a direct path to the database
         """
         # Skip initialization if already initialized
-        if getattr(self, '_initialized', False):
+        if self._initialized:
             return
-            
+        
+        with self._lock:
+            if not self._initialized:
+                self._setup(config_or_path)
+    
+    def _setup(self, config_or_path: Union[object, str]):
+        """Set up the connection state and the schema; runs once per database.
+        
+        Args:
+            config_or_path: Either an application configuration object or a direct path to the database
+        """
         # Handle either a config object or a direct path string
         if isinstance(config_or_path, str):
             self.config = None
@@ -51,36 +192,189 @@ class DatabaseManager:
             self.config = config_or_path
             self.db_path = config_or_path.database_path
         
-        # Create database directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        # Create database directory if it doesn't exist; ":memory:" and bare
+        # file names have none
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
         
         # Initialize connection management
-        self._max_retries = 5
-        self._retry_delay = 0.1  # seconds
+        # SQLite waits out locks itself (see BUSY_TIMEOUT_MS), so only the
+        # rare lock error that escapes the busy timeout is retried
+        self._max_retries = 3
+        self._retry_delay = 0.1  # seconds, upper bound of the random delay
+        # Lock errors that reached _execute_with_retry, to observe contention
+        self._busy_count = 0
+        self._busy_lock = threading.Lock()
+        # Connection of the transaction open on each thread, if any
+        self._local = threading.local()
+        # Idle read-only connections, reused most-recent first
+        self._read_pool = queue.LifoQueue(maxsize=READ_POOL_SIZE)
+        # Single connection shared by all writes, one thread at a time
+        self._write_conn = None
+        self._write_lock = threading.RLock()
+        # Commits made through this manager, guarded by the write lock; other
+        # connections' commits show up in the write connection's data_version
+        self._commit_count = 0
         
         # Initialize the database
         self._initialize_database()
         self._initialized = True
     
-    def _get_connection(self):
-        """Get a database connection for the current thread.
+    def _open_connection(self, readonly: bool = False):
+        """Open and configure a new database connection.
         
+        Args:
+            readonly: Open the database read-only
+            
         Returns:
             sqlite3.Connection: A connection to the database
         """
-        # Always create a new connection
-        connection = sqlite3.connect(self.db_path, timeout=20.0)
+        # Pooled connections are handed between threads, one at a time
+        if readonly:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            connection = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
+            connection.execute("PRAGMA query_only = ON")
+        else:
+            connection = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_MS / 1000, check_same_thread=False)
         # Enable foreign keys
         connection.execute("PRAGMA foreign_keys = ON")
+        if self.db_path != ":memory:":
+            # With WAL, commits need not sync every write to disk
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.execute("PRAGMA temp_store = MEMORY")
+            connection.execute(f"PRAGMA cache_size = {CACHE_SIZE_KIB}")
+            connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
         return connection
     
-    def _close_connection(self, connection):
-        """Close the database connection."""
+    def _get_connection(self):
+        """Get a dedicated database connection.
+        
+        The connection is neither pooled nor shared with an open transaction;
+        the caller is responsible for closing it. Use _conn() to take part in
+        the current thread's transaction.
+        
+        Returns:
+            sqlite3.Connection: A connection to the database
+        """
+        return self._open_connection()
+    
+    @contextmanager
+    def _conn(self, readonly: bool = False):
+        """Borrow a pooled database connection for the duration of the block.
+        
+        Reads take an idle read-only connection from the pool and put it back
+        afterwards. Writes share a single connection, used by one thread at a
+        time, and are committed when the block exits or rolled back if it
+        raises. Inside transaction() the transaction's connection is used and
+        left for the transaction to commit.
+        
+        Args:
+            readonly: Whether the block only reads from the database
+            
+        Yields:
+            sqlite3.Connection: A connection to the database
+        """
+        connection = getattr(self._local, "connection", None)
         if connection is not None:
-            connection.close()
+            connection.row_factory = None
+            yield connection
+            return
+        
+        # Every connection to an in-memory database is a separate database
+        if not readonly or self.db_path == ":memory:":
+            with self._write_lock:
+                if self._write_conn is None:
+                    self._write_conn = self._open_connection()
+                connection = self._write_conn
+                connection.row_factory = None
+                try:
+                    yield connection
+                    connection.commit()
+                    self._commit_count += 1
+                except BaseException:
+                    connection.rollback()
+                    raise
+            return
+        
+        try:
+            connection = self._read_pool.get_nowait()
+        except queue.Empty:
+            connection = self._open_connection(readonly=True)
+        connection.row_factory = None
+        try:
+            yield connection
+        finally:
+            # An open transaction would pin an old snapshot of the database
+            if connection.in_transaction:
+                connection.rollback()
+            try:
+                self._read_pool.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+    
+    def close(self):
+        """Close the pooled database connections."""
+        with self._write_lock:
+            if self._write_conn is not None:
+                # Refresh the statistics of the tables this process queried
+                self._write_conn.execute("PRAGMA optimize")
+                self._write_conn.close()
+                self._write_conn = None
+        while True:
+            try:
+                self._read_pool.get_nowait().close()
+            except queue.Empty:
+                break
+    
+    @contextmanager
+    def transaction(self):
+        """Run several database operations in a single transaction.
+        
+        Operations called on this thread inside the block share one connection
+        and are committed together when the block exits, or rolled back if it
+        raises. Nested blocks join the outer transaction.
+        """
+        if getattr(self._local, "connection", None) is not None:
+            yield
+            return
+        
+        # Every connection to an in-memory database is a separate database, so
+        # its transactions run on the shared write connection
+        in_memory = self.db_path == ":memory:"
+        if in_memory:
+            self._write_lock.acquire()
+            if self._write_conn is None:
+                self._write_conn = self._open_connection()
+            connection = self._write_conn
+        else:
+            connection = self._get_connection()
+        try:
+            # Take the write lock up front so the operations cannot deadlock halfway
+            self._execute_with_retry(connection.execute, "BEGIN IMMEDIATE")
+            self._local.connection = connection
+            try:
+                yield
+                connection.commit()
+                with self._write_lock:
+                    self._commit_count += 1
+            except BaseException:
+                connection.rollback()
+                raise
+            finally:
+                self._local.connection = None
+        finally:
+            if in_memory:
+                self._write_lock.release()
+            else:
+                connection.close()
     
     def _execute_with_retry(self, operation, *args, **kwargs):
-        """Execute a database operation with retry logic for handling locks.
+        """Execute a database operation, retrying if the database stays locked.
+        
+        Connections already wait for locks for up to BUSY_TIMEOUT_MS inside
+        SQLite, so a lock error is retried at most twice, after a short
+        random delay.
         
         Args:
             operation: Function to execute
@@ -98,9 +392,10 @@ class DatabaseManager:
                 return operation(*args, **kwargs)
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e) and attempt < self._max_retries - 1:
-                    # Close and reopen the connection
-                    # Exponential backoff
-                    delay = self._retry_delay * (2 ** attempt)
+                    with self._busy_lock:
+                        self._busy_count += 1
+                    # Jitter so contending threads don't retry in lockstep
+                    delay = random.uniform(0, self._retry_delay)
                     logger.warning(f"Database is locked, retrying in {delay:.2f} seconds (attempt {attempt+1}/{self._max_retries})")
                     time.sleep(delay)
                 else:
@@ -113,85 +408,117 @@ class DatabaseManager:
     def _initialize_database(self):
         """Initialize the database schema if it doesn't exist."""
         def initialize_schema():
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Create users table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    email TEXT NOT NULL,
-                    hash_key TEXT UNIQUE NOT NULL,
-                    name TEXT,
-                    company TEXT,
-                    role TEXT,
-                    api_key TEXT,
-                    onboarded_at TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_login TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create meetings table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS meetings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_hash_key TEXT NOT NULL,
-                    url TEXT NOT NULL,
-                    title TEXT,
-                    meeting_id TEXT,
-                    password TEXT,
-                    scheduled_time TEXT,
-                    start_time TIMESTAMP,
-                    end_time TIMESTAMP,
-                    actual_start_time TEXT,
-                    actual_end_time TEXT,
-                    candidate_name TEXT,
-                    position TEXT,
-                    status TEXT,
-                    bot_id TEXT,
-                    recording_path TEXT,
-                    transcript_path TEXT,
-                    analytics_path TEXT,
-                    insights_path TEXT,
-                    report_path TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_hash_key) REFERENCES users (hash_key)
-                )
-            ''')
-            
-            # Create analysis_results table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS analysis_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    meeting_id INTEGER NOT NULL,
-                    result_type TEXT NOT NULL,
-                    result_data TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (meeting_id) REFERENCES meetings (id)
-                )
-            ''')
-            
-            # Create meeting_participants table (many-to-many relationship)
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS meeting_participants (
-                    meeting_id INTEGER,
-                    user_hash_key TEXT,
-                    role TEXT,
-                    PRIMARY KEY (meeting_id, user_hash_key),
-                    FOREIGN KEY (meeting_id) REFERENCES meetings (id),
-                    FOREIGN KEY (user_hash_key) REFERENCES users (hash_key)
-                )
-            ''')
-            
-            conn.commit()
-            self._close_connection(conn)
+            with self._conn() as conn:
+                # Use write-ahead logging so readers don't block the writer; the
+                # journal mode is stored in the database file
+                if self.db_path != ":memory:":
+                    conn.execute("PRAGMA journal_mode = WAL").fetchone()
+                
+                # Create the tables and indexes in one transaction, so
+                # concurrent startups see either none or all of the schema
+                conn.executescript('''
+                    BEGIN;
+                    
+                    CREATE TABLE IF NOT EXISTS users (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        email TEXT NOT NULL,
+                        hash_key TEXT UNIQUE NOT NULL,
+                        name TEXT,
+                        company TEXT,
+                        role TEXT,
+                        api_key TEXT,
+                        onboarded_at TIMESTAMP,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        last_login TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS meetings (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_hash_key TEXT NOT NULL,
+                        url TEXT NOT NULL,
+                        title TEXT,
+                        meeting_id TEXT,
+                        password TEXT,
+                        scheduled_time TEXT,
+                        start_time TIMESTAMP,
+                        end_time TIMESTAMP,
+                        actual_start_time TEXT,
+                        actual_end_time TEXT,
+                        candidate_name TEXT,
+                        position TEXT,
+                        status TEXT,
+                        bot_id TEXT,
+                        recording_path TEXT,
+                        transcript_path TEXT,
+                        analytics_path TEXT,
+                        insights_path TEXT,
+                        report_path TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (user_hash_key) REFERENCES users (hash_key)
+                    );
+                    
+                    CREATE TABLE IF NOT EXISTS analysis_results (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        meeting_id INTEGER NOT NULL,
+                        result_type TEXT NOT NULL,
+                        result_data TEXT,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (meeting_id) REFERENCES meetings (id)
+                    );
+                    
+                    -- Many-to-many relationship between meetings and users
+                    CREATE TABLE IF NOT EXISTS meeting_participants (
+                        meeting_id INTEGER,
+                        user_hash_key TEXT,
+                        role TEXT,
+                        PRIMARY KEY (meeting_id, user_hash_key),
+                        FOREIGN KEY (meeting_id) REFERENCES meetings (id),
+                        FOREIGN KEY (user_hash_key) REFERENCES users (hash_key)
+                    );
+                    
+                    -- Indexes for the common lookups; users.hash_key is
+                    -- already indexed by its UNIQUE constraint
+                    CREATE INDEX IF NOT EXISTS idx_users_email ON users (email);
+                    -- Also serves the ORDER BY in get_user_meetings
+                    CREATE INDEX IF NOT EXISTS idx_meetings_user
+                        ON meetings (user_hash_key, created_at DESC);
+                    CREATE INDEX IF NOT EXISTS idx_meetings_url ON meetings (url);
+                    CREATE INDEX IF NOT EXISTS idx_meetings_zoom ON meetings (meeting_id);
+                    CREATE INDEX IF NOT EXISTS idx_analysis_meeting
+                        ON analysis_results (meeting_id, result_type);
+                    
+                    COMMIT;
+                ''')
+                
+                # Gather statistics so the query planner picks the indexes; only
+                # once, when the database has none yet, as ANALYZE scans every table
+                if conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone() is None:
+                    conn.execute('ANALYZE')
             logger.info("Database initialized successfully")
             
         self._execute_with_retry(initialize_schema)
     
+    def checkpoint(self):
+        """Copy committed changes from the write-ahead log back into the database file.
+        
+        Runs a passive checkpoint, which never waits on readers or writers, so
+        it is safe to call periodically from long-running processes.
+        
+        Returns:
+            Tuple of (busy, log pages, checkpointed pages) reported by SQLite
+        """
+        def checkpoint_operation():
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                result = tuple(cursor.fetchone())
+            
+            return result
+            
+        return self._execute_with_retry(checkpoint_operation)
+    
     def _generate_hash_key(self, email: str) -> str:
         """Generate a unique hash key for a user.
         
@@ -201,12 +528,10 @@ class DatabaseManager:
         Returns:
             A unique hash key
         """
-        # Create a hash using the email and a salt
-        # This is a simple implementation - in production, use a more secure method
-        salt = os.urandom(16).hex()
-        hash_input = f"{email}:{salt}"
-        hash_key = hashlib.sha256(hash_input.encode()).hexdigest()
-        return hash_key
+        # The key only has to be unique, since one email can belong to several
+        # users, so a random token is enough; hashing the email with a salt
+        # that is thrown away adds nothing. 64 hex characters, as before.
+        return secrets.token_hex(32)
     
     def add_user(self, email: str, name: str = None, company: str = None, 
                  role: str = None, api_key: str = None, hash_key: str = None,
@@ -229,44 +554,118 @@ class DatabaseManager:
         def add_user_operation():
             # Generate a hash key if not provided
             user_hash_key = hash_key if hash_key else self._generate_hash_key(email)
+            # Timestamps use the same local clock as the updates
+            now = datetime.now().isoformat()
             
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            try:
-                cursor.execute('''
-                    INSERT INTO users (email, hash_key, name, company, role, api_key, onboarded_at, last_login)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (email, user_hash_key, name, company, role, api_key, onboarded_at, last_login))
+            with self._conn() as conn:
+                cursor = conn.cursor()
                 
-                user_id = cursor.lastrowid
-                conn.commit()
-                self._close_connection(conn)
-                logger.info(f"Added user with email {email} and hash key {user_hash_key}")
-                return user_id
-            except sqlite3.IntegrityError as e:
-                # If the hash_key already exists, this will fail
-                if "UNIQUE constraint failed: users.hash_key" in str(e):
-                    logger.warning(f"User with hash key {user_hash_key} already exists")
-                    # Get the existing user ID
-                    cursor.execute('SELECT id FROM users WHERE hash_key = ?', (user_hash_key,))
-                    row = cursor.fetchone()
-                    if row:
-                        self._close_connection(conn)
-                        return row[0]
-                    self._close_connection(conn)
-                    return None
-                else:
+                try:
+                    if _SQLITE_HAS_RETURNING:
+                        # An existing hash key returns no row instead of raising
+                        cursor.execute('''
+                            INSERT INTO users (email, hash_key, name, company, role, api_key, onboarded_at, last_login,
+                                               created_at, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            ON CONFLICT (hash_key) DO NOTHING
+                            RETURNING id
+                        ''', (email, user_hash_key, name, company, role, api_key, onboarded_at, last_login, now, now))
+                        row = cursor.fetchone()
+                        if row is None:
+                            logger.warning(f"User with hash key {user_hash_key} already exists")
+                            cursor.execute('SELECT id FROM users WHERE hash_key = ?', (user_hash_key,))
+                            row = cursor.fetchone()
+                            return row[0] if row else None
+                        user_id = row[0]
+                    else:
+                        cursor.execute('''
+                            INSERT INTO users (email, hash_key, name, company, role, api_key, onboarded_at, last_login,
+                                               created_at, updated_at)
+                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ''', (email, user_hash_key, name, company, role, api_key, onboarded_at, last_login, now, now))
+                        user_id = cursor.lastrowid
+                    
+                    logger.info(f"Added user with email {email} and hash key {user_hash_key}")
+                    return user_id
+                except sqlite3.IntegrityError as e:
+                    # If the hash_key already exists, this will fail
+                    if "UNIQUE constraint failed: users.hash_key" in str(e):
+                        logger.warning(f"User with hash key {user_hash_key} already exists")
+                        # Get the existing user ID
+                        cursor.execute('SELECT id FROM users WHERE hash_key = ?', (user_hash_key,))
+                        row = cursor.fetchone()
+                        if row:
+                            return row[0]
+                        return None
+                    else:
+                        logger.error(f"Database error: {str(e)}")
+                        return None
+                except Exception as e:
                     logger.error(f"Database error: {str(e)}")
-                    self._close_connection(conn)
-                    return None
-            except Exception as e:
-                logger.error(f"Database error: {str(e)}")
-                self._close_connection(conn)
-                raise
+                    raise
             
         return self._execute_with_retry(add_user_operation)
     
+    def add_users(self, users: List[Dict]) -> List[int]:
+        """Add several users to the database in a single transaction.
+        
+        Args:
+            users: Dictionaries of add_user arguments; "email" is required
+            
+        Returns:
+            List of the new user IDs, in the order of users
+        """
+        columns = ('email', 'hash_key', 'name', 'company', 'role', 'api_key', 'onboarded_at', 'last_login',
+                   'created_at', 'updated_at')
+        # Timestamps use the same local clock as the updates
+        now = datetime.now().isoformat()
+        rows = []
+        for user in users:
+            row = [user.get(column) for column in columns[:-2]] + [now, now]
+            # Generate a hash key if not provided
+            row[1] = row[1] or self._generate_hash_key(row[0])
+            rows.append(row)
+        if not rows:
+            return []
+        
+        def add_users_operation():
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(f'''
+                    INSERT INTO users ({", ".join(columns)})
+                    VALUES ({", ".join("?" * len(columns))})
+                ''', rows)
+                
+                # The rows were inserted back to back under the write lock,
+                # so their IDs are consecutive
+                last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            
+            logger.info(f"Added {len(rows)} users")
+            return list(range(last_id - len(rows) + 1, last_id + 1))
+            
+        return self._execute_with_retry(add_users_operation)
+    
+    def _select_user(self, column: str, value, limit: int = -1) -> List[Dict]:
+        """Get the users whose column matches a value.
+        
+        Args:
+            column: Column to match, one of "id", "email" or "hash_key"
+            value: Value to match
+            limit: Maximum number of users to return, or -1 for all of them
+            
+        Returns:
+            List of dictionaries containing user information
+        """
+        def select_user_operation():
+            with self._conn(readonly=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SELECT_USER_SQL[column], (value, limit))
+                rows = cursor.fetchall()
+            
+            return [dict(zip(_USER_COLUMNS, row)) for row in rows]
+            
+        return self._execute_with_retry(select_user_operation)
+    
     def get_users_by_email(self, email: str) -> List[Dict]:
         """Get all users with a specific email address.
         
@@ -276,18 +675,30 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing user information
         """
-        def get_users_by_email_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM users WHERE email = ?', (email,))
-            rows = cursor.fetchall()
-            self._close_connection(conn)
-            
-            return [dict(row) for row in rows]
+        return list(self.iter_users_by_email(email))
+    
+    def iter_users_by_email(self, email: str):
+        """Iterate over the users with a specific email address.
+        
+        Args:
+            email: User's email address
             
-        return self._execute_with_retry(get_users_by_email_operation)
+        Yields:
+            Dictionaries containing user information, in ID order
+        """
+        sql = (
+            f"SELECT {', '.join(_USER_COLUMNS)} FROM users "
+            "WHERE email = ? AND id > ? ORDER BY id LIMIT ?"
+        )
+        last_id = 0
+        while True:
+            with self._conn(readonly=True) as conn:
+                rows = conn.execute(sql, (email, last_id, READ_BATCH_SIZE)).fetchall()
+            for row in rows:
+                yield dict(zip(_USER_COLUMNS, row))
+            if len(rows) < READ_BATCH_SIZE:
+                return
+            last_id = rows[-1][0]
     
     def get_user_by_hash_key(self, hash_key: str) -> Optional[Dict]:
         """Get user information from the database by hash key.
@@ -298,20 +709,8 @@ class DatabaseManager:
         Returns:
             Dictionary containing user information or None if not found
         """
-        def get_user_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM users WHERE hash_key = ?', (hash_key,))
-            row = cursor.fetchone()
-            self._close_connection(conn)
-            
-            if row:
-                return dict(row)
-            return None
-            
-        return self._execute_with_retry(get_user_operation)
+        users = self._select_user('hash_key', hash_key, 1)
+        return users[0] if users else None
     
     def get_user(self, user_id: int = None, email: str = None, hash_key: str = None) -> Optional[Dict]:
         """Get user information from the database.
@@ -324,30 +723,17 @@ class DatabaseManager:
         Returns:
             Dictionary containing user information or None if not found
         """
-        def get_user_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            if user_id:
-                cursor.execute('SELECT * FROM users WHERE id = ?', (user_id,))
-            elif hash_key:
-                cursor.execute('SELECT * FROM users WHERE hash_key = ?', (hash_key,))
-            elif email:
-                cursor.execute('SELECT * FROM users WHERE email = ? LIMIT 1', (email,))
-            else:
-                logger.error("Either user_id, email, or hash_key must be provided")
-                self._close_connection(conn)
-                return None
-            
-            row = cursor.fetchone()
-            self._close_connection(conn)
-            
-            if row:
-                return dict(row)
+        if user_id:
+            users = self._select_user('id', user_id, 1)
+        elif hash_key:
+            users = self._select_user('hash_key', hash_key, 1)
+        elif email:
+            users = self._select_user('email', email, 1)
+        else:
+            logger.error("Either user_id, email, or hash_key must be provided")
             return None
-            
-        return self._execute_with_retry(get_user_operation)
+        
+        return users[0] if users else None
     
     def verify_hash_key(self, email: str, hash_key: str) -> bool:
         """Verify if a hash key matches an existing user with the given email.
@@ -360,21 +746,20 @@ class DatabaseManager:
             True if the hash key is valid for the email, False otherwise
         """
         def verify_hash_key_operation():
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM users WHERE email = ? AND hash_key = ?', 
-                          (email, hash_key))
-            count = cursor.fetchone()[0]
-            self._close_connection(conn)
+            with self._conn(readonly=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT 1 FROM users WHERE email = ? AND hash_key = ? LIMIT 1', 
+                              (email, hash_key))
+                found = cursor.fetchone() is not None
             
-            return count > 0
+            return found
             
         return self._execute_with_retry(verify_hash_key_operation)
     
     def add_meeting(self, user_hash_key: str, url: str, title: str = None, 
                    scheduled_time: str = None, status: str = 'scheduled',
-                   meeting_id: str = None, password: str = None) -> int:
+                   meeting_id: str = None, password: str = None,
+                   candidate_name: str = None, position: str = None) -> int:
         """Add a new meeting to the database.
         
         Args:
@@ -385,41 +770,69 @@ class DatabaseManager:
             status: Meeting status (default: 'scheduled')
             meeting_id: Zoom meeting ID (optional)
             password: Zoom meeting password (optional)
+            candidate_name: Name of the interview candidate (optional)
+            position: Position the candidate is interviewing for (optional)
             
         Returns:
             Meeting ID if successful, None otherwise
         """
         def add_meeting_operation():
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            # Verify that the hash key exists
-            cursor.execute('SELECT COUNT(*) FROM users WHERE hash_key = ?', (user_hash_key,))
-            count = cursor.fetchone()[0]
-            
-            if count == 0:
-                logger.error(f"User with hash key {user_hash_key} not found")
-                self._close_connection(conn)
-                return None
-            
-            try:
-                cursor.execute('''
-                    INSERT INTO meetings (user_hash_key, url, title, scheduled_time, status, meeting_id, password)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (user_hash_key, url, title, scheduled_time, status, meeting_id, password))
+            with self._conn() as conn:
+                cursor = conn.cursor()
                 
-                new_meeting_id = cursor.lastrowid
-                conn.commit()
-                self._close_connection(conn)
-                logger.info(f"Added meeting with ID {new_meeting_id} for user with hash key {user_hash_key}")
-                return new_meeting_id
-            except Exception as e:
-                logger.error(f"Database error: {str(e)}")
-                self._close_connection(conn)
-                return None
+                # Verify that the hash key exists
+                cursor.execute('SELECT 1 FROM users WHERE hash_key = ? LIMIT 1', (user_hash_key,))
+                
+                if cursor.fetchone() is None:
+                    logger.error(f"User with hash key {user_hash_key} not found")
+                    return None
+                
+                try:
+                    # Timestamps use the same local clock as the updates
+                    now = datetime.now().isoformat()
+                    cursor.execute('''
+                        INSERT INTO meetings (user_hash_key, url, title, scheduled_time, status, meeting_id, password,
+                                              candidate_name, position, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (user_hash_key, url, title, scheduled_time, status, meeting_id, password,
+                          candidate_name, position, now, now))
+                    
+                    new_meeting_id = cursor.lastrowid
+                    logger.info(f"Added meeting with ID {new_meeting_id} for user with hash key {user_hash_key}")
+                    return new_meeting_id
+                except Exception as e:
+                    logger.error(f"Database error: {str(e)}")
+                    return None
             
         return self._execute_with_retry(add_meeting_operation)
     
+    def add_meeting_participant(self, meeting_id: int, user_hash_key: str, role: str = None) -> bool:
+        """Add a user to a meeting's participants.
+        
+        Args:
+            meeting_id: Meeting ID
+            user_hash_key: Participant's hash key
+            role: Participant's role in the meeting, e.g. "interviewer" (optional)
+            
+        Returns:
+            True if the participant was added or their role updated, False otherwise
+        """
+        def add_meeting_participant_operation():
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute('''
+                        INSERT INTO meeting_participants (meeting_id, user_hash_key, role)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT (meeting_id, user_hash_key) DO UPDATE SET role = excluded.role
+                    ''', (meeting_id, user_hash_key, role))
+                    return True
+                except Exception as e:
+                    logger.error(f"Database error: {str(e)}")
+                    return False
+            
+        return self._execute_with_retry(add_meeting_participant_operation)
+    
     def get_meeting(self, meeting_id: int) -> Optional[Dict]:
         """Get meeting information from the database.
         
@@ -430,13 +843,11 @@ class DatabaseManager:
             Dictionary containing meeting information or None if not found
         """
         def get_meeting_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT * FROM meetings WHERE id = ?', (meeting_id,))
-            row = cursor.fetchone()
-            self._close_connection(conn)
+            with self._conn(readonly=True) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.execute('SELECT * FROM meetings WHERE id = ?', (meeting_id,))
+                row = cursor.fetchone()
             
             if row:
                 return dict(row)
@@ -444,27 +855,158 @@ class DatabaseManager:
             
         return self._execute_with_retry(get_meeting_operation)
     
-    def get_user_meetings(self, user_hash_key: str) -> List[Dict]:
+    def get_meeting_full(self, meeting_id: int) -> Optional[Dict]:
+        """Get a meeting together with its organizer, participants and analysis results.
+        
+        Everything is read over a single connection: the meeting and its
+        organizer in one join, then the participants and the analysis results.
+        
+        Args:
+            meeting_id: Meeting ID
+            
+        Returns:
+            Dictionary with "meeting", "organizer", "participants" and
+            "analysis_results" entries, or None if the meeting was not found.
+            Analysis result data is left as the stored JSON string.
+        """
+        def get_meeting_full_operation():
+            with self._conn(readonly=True) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT m.*, u.name AS organizer_name, u.email AS organizer_email,
+                           u.company AS organizer_company, u.role AS organizer_role
+                    FROM meetings m
+                    LEFT JOIN users u ON u.hash_key = m.user_hash_key
+                    WHERE m.id = ?
+                ''', (meeting_id,))
+                row = cursor.fetchone()
+                if not row:
+                    return None
+                
+                meeting = dict(row)
+                organizer = {
+                    "name": meeting.pop("organizer_name"),
+                    "email": meeting.pop("organizer_email"),
+                    "company": meeting.pop("organizer_company"),
+                    "role": meeting.pop("organizer_role")
+                }
+                
+                cursor.execute('''
+                    SELECT u.name, u.email, u.company, u.role, mp.role AS participant_role
+                    FROM meeting_participants mp
+                    JOIN users u ON u.hash_key = mp.user_hash_key
+                    WHERE mp.meeting_id = ?
+                ''', (meeting_id,))
+                participants = [dict(row) for row in cursor.fetchall()]
+                
+                cursor.execute('SELECT * FROM analysis_results WHERE meeting_id = ? ORDER BY id', (meeting_id,))
+                analysis_results = [dict(row) for row in cursor.fetchall()]
+            
+            return {
+                "meeting": meeting,
+                # Users always have an email, so a missing one means no matching user
+                "organizer": organizer if organizer["email"] is not None else None,
+                "participants": participants,
+                "analysis_results": analysis_results
+            }
+            
+        return self._execute_with_retry(get_meeting_full_operation)
+    
+    def get_user_meetings(self, user_hash_key: str) -> List[Meeting]:
         """Get all meetings for a user.
         
         Args:
             user_hash_key: User's hash key
             
         Returns:
-            List of dictionaries containing meeting information
+            List of Meeting rows, most recently created first
         """
-        def get_user_meetings_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        return list(self.iter_user_meetings(user_hash_key))
+    
+    def iter_user_meetings(self, user_hash_key: str):
+        """Iterate over a user's meetings, most recently created first.
+        
+        Rows are read in batches of READ_BATCH_SIZE as the caller consumes
+        them, and no connection is held between batches, so the full result is
+        never held in memory at once and stopping early is safe.
+        
+        Args:
+            user_hash_key: User's hash key
             
-            cursor.execute('SELECT * FROM meetings WHERE user_hash_key = ? ORDER BY created_at DESC', (user_hash_key,))
-            rows = cursor.fetchall()
-            self._close_connection(conn)
+        Yields:
+            Meeting rows
+        """
+        first_sql = (
+            f'SELECT {_MEETING_COLUMNS} FROM meetings WHERE user_hash_key = ? '
+            'ORDER BY created_at DESC, id DESC LIMIT ?'
+        )
+        next_sql = (
+            f'SELECT {_MEETING_COLUMNS} FROM meetings WHERE user_hash_key = ? '
+            'AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC LIMIT ?'
+        )
+        rows = None
+        while True:
+            with self._conn(readonly=True) as conn:
+                if rows is None:
+                    rows = conn.execute(first_sql, (user_hash_key, READ_BATCH_SIZE)).fetchall()
+                else:
+                    last = Meeting._make(rows[-1])
+                    rows = conn.execute(
+                        next_sql, (user_hash_key, last.created_at, last.id, READ_BATCH_SIZE)
+                    ).fetchall()
+            yield from map(Meeting._make, rows)
+            if len(rows) < READ_BATCH_SIZE:
+                return
+    
+    def get_meetings(self, status: str = None, limit: int = 10) -> List[Dict]:
+        """Get the most recently created meetings.
+        
+        Args:
+            status: Only include meetings with this status (optional)
+            limit: Maximum number of meetings to return
+            
+        Returns:
+            List of dictionaries containing meeting information
+        """
+        def get_meetings_operation():
+            with self._conn(readonly=True) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                if status:
+                    cursor.execute(
+                        'SELECT * FROM meetings WHERE status = ? ORDER BY created_at DESC, id DESC LIMIT ?',
+                        (status, limit)
+                    )
+                else:
+                    cursor.execute('SELECT * FROM meetings ORDER BY created_at DESC, id DESC LIMIT ?', (limit,))
+                rows = cursor.fetchall()
             
             return [dict(row) for row in rows]
             
-        return self._execute_with_retry(get_user_meetings_operation)
+        return self._execute_with_retry(get_meetings_operation)
+    
+    def get_meetings_etag(self) -> Tuple:
+        """Get a cheap fingerprint of the database contents.
+        
+        The fingerprint changes after every commit to the database, whether
+        made through this manager or by another connection or process, so it
+        can be used to invalidate cached meeting listings.
+        
+        Returns:
+            Tuple of the write connection's data_version and this manager's commit count
+        """
+        def get_meetings_etag_operation():
+            with self._write_lock:
+                if self._write_conn is None:
+                    self._write_conn = self._open_connection()
+                # data_version changes when any other connection commits, but
+                # not for the write connection's own commits, which are counted
+                data_version = self._write_conn.execute('PRAGMA data_version').fetchone()[0]
+                return (data_version, self._commit_count)
+            
+        return self._execute_with_retry(get_meetings_etag_operation)
     
     def find_meeting_by_url_or_id(self, url: str = None, zoom_meeting_id: str = None) -> Optional[Dict]:
         """Find a meeting by URL or Zoom meeting ID.
@@ -481,19 +1023,25 @@ class DatabaseManager:
             return None
             
         def find_meeting_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            if url and zoom_meeting_id:
-                cursor.execute('SELECT * FROM meetings WHERE url = ? OR meeting_id = ?', (url, zoom_meeting_id))
-            elif url:
-                cursor.execute('SELECT * FROM meetings WHERE url = ?', (url,))
-            else:
-                cursor.execute('SELECT * FROM meetings WHERE meeting_id = ?', (zoom_meeting_id,))
+            with self._conn(readonly=True) as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
                 
-            row = cursor.fetchone()
-            self._close_connection(conn)
+                if url and zoom_meeting_id:
+                    # Each arm is a single index probe, where an OR may scan;
+                    # a meeting matching the URL is preferred
+                    cursor.execute('''
+                        SELECT * FROM meetings WHERE url = ?
+                        UNION ALL
+                        SELECT * FROM meetings WHERE meeting_id = ?
+                        LIMIT 1
+                    ''', (url, zoom_meeting_id))
+                elif url:
+                    cursor.execute('SELECT * FROM meetings WHERE url = ?', (url,))
+                else:
+                    cursor.execute('SELECT * FROM meetings WHERE meeting_id = ?', (zoom_meeting_id,))
+                    
+                row = cursor.fetchone()
             
             if row:
                 return dict(row)
@@ -516,52 +1064,50 @@ class DatabaseManager:
                 logger.warning("No fields provided for update")
                 return False
             
-            # Build the update query
-            fields = []
-            values = []
-            
-            valid_fields = [
-                'url', 'title', 'meeting_id', 'password',
-                'scheduled_time', 'start_time', 'end_time',
-                'actual_start_time', 'actual_end_time', 
-                'candidate_name', 'position', 'status', 'bot_id',
-                'recording_path', 'transcript_path', 'analytics_path', 
-                'insights_path', 'report_path'
-            ]
-            
-            for key, value in kwargs.items():
-                if key in valid_fields:
-                    fields.append(f"{key} = ?")
-                    values.append(value)
-            
+            # Sorted, so any order of the same fields reuses one statement
+            fields = tuple(sorted(_MEETING_UPDATE_FIELDS.intersection(kwargs)))
             if not fields:
                 logger.warning("No valid fields provided for update")
                 return False
             
-            # Add updated_at timestamp
-            fields.append("updated_at = ?")
+            values = [kwargs[field] for field in fields]
             values.append(datetime.now().isoformat())
-            
-            # Add meeting_id to values
             values.append(meeting_id)
             
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute(f'''
-                UPDATE meetings
-                SET {", ".join(fields)}
-                WHERE id = ?
-            ''', values)
-            
-            conn.commit()
-            self._close_connection(conn)
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_update_sql('meetings', 'id', fields), values)
             
             logger.info(f"Updated meeting with ID {meeting_id}")
             return True
             
         return self._execute_with_retry(update_meeting_operation)
     
+    def update_meeting_status_checked(self, meeting_id: int, status: str) -> bool:
+        """Update a meeting's status, reporting whether the meeting exists.
+        
+        Args:
+            meeting_id: Meeting ID
+            status: New meeting status
+            
+        Returns:
+            True if the meeting was found and updated, False if it does not exist
+        """
+        def update_meeting_status_operation():
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    'UPDATE meetings SET status = ?, updated_at = ? WHERE id = ? RETURNING id',
+                    (status, datetime.now().isoformat(), meeting_id)
+                )
+                updated = cursor.fetchone() is not None
+            
+            if updated:
+                logger.info(f"Updated status of meeting {meeting_id} to {status}")
+            return updated
+            
+        return self._execute_with_retry(update_meeting_status_operation)
+    
     def update_user(self, user_hash_key: str = None, **kwargs) -> bool:
         """Update user information in the database.
         
@@ -581,36 +1127,19 @@ class DatabaseManager:
                 logger.error("User hash key must be provided")
                 return False
             
-            # Build the update query
-            fields = []
-            values = []
-            
-            for key, value in kwargs.items():
-                if key in ['email', 'name', 'company', 'role', 'api_key', 'onboarded_at', 'last_login']:
-                    fields.append(f"{key} = ?")
-                    values.append(value)
-            
+            # Sorted, so any order of the same fields reuses one statement
+            fields = tuple(sorted(_USER_UPDATE_FIELDS.intersection(kwargs)))
             if not fields:
                 logger.warning("No valid fields provided for update")
                 return False
             
-            # Add updated_at timestamp
-            fields.append("updated_at = ?")
+            values = [kwargs[field] for field in fields]
             values.append(datetime.now().isoformat())
-            
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
             values.append(user_hash_key)
-                
-            cursor.execute(f'''
-                UPDATE users
-                SET {", ".join(fields)}
-                WHERE hash_key = ?
-            ''', values)
             
-            conn.commit()
-            self._close_connection(conn)
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_update_sql('users', 'hash_key', fields), values)
             
             logger.info(f"Updated user with hash key {user_hash_key}")
             return True
@@ -628,25 +1157,41 @@ class DatabaseManager:
         Returns:
             Analysis result ID
         """
-        def add_analysis_result_operation():
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT INTO analysis_results (meeting_id, result_type, result_data)
-                VALUES (?, ?, ?)
-            ''', (meeting_id, result_type, json.dumps(result_data)))
+        return self.add_analysis_results(meeting_id, [(result_type, result_data)])[0]
+    
+    def add_analysis_results(self, meeting_id: int, items: List[Tuple[str, Dict]]) -> List[int]:
+        """Add several analysis results for a meeting in a single transaction.
+        
+        Args:
+            meeting_id: Meeting ID
+            items: (result type, result data) pairs
             
-            result_id = cursor.lastrowid
-            conn.commit()
-            self._close_connection(conn)
+        Returns:
+            List of the new analysis result IDs, in the order of items
+        """
+        rows = [(meeting_id, result_type, _dump_json(result_data)) for result_type, result_data in items]
+        if not rows:
+            return []
+        
+        def add_analysis_results_operation():
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.executemany('''
+                    INSERT INTO analysis_results (meeting_id, result_type, result_data)
+                    VALUES (?, ?, ?)
+                ''', rows)
+                
+                # The rows were inserted back to back under the write lock,
+                # so their IDs are consecutive
+                last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
             
-            logger.info(f"Added new analysis result with ID {result_id} for meeting {meeting_id}")
-            return result_id
+            result_ids = list(range(last_id - len(rows) + 1, last_id + 1))
+            logger.info(f"Added analysis results with IDs {result_ids} for meeting {meeting_id}")
+            return result_ids
             
-        return self._execute_with_retry(add_analysis_result_operation)
+        return self._execute_with_retry(add_analysis_results_operation)
     
-    def get_analysis_results(self, meeting_id: int, result_type: str = None) -> List[Dict]:
+    def get_analysis_results(self, meeting_id: int, result_type: str = None) -> List[AnalysisResult]:
         """Get analysis results for a meeting.
         
         Args:
@@ -654,38 +1199,79 @@ class DatabaseManager:
             result_type: Type of analysis result (optional)
             
         Returns:
-            List of dictionaries containing analysis results
+            List of AnalysisResult rows
         """
-        def get_analysis_results_operation():
-            conn = self._get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            if result_type:
-                cursor.execute(
-                    'SELECT * FROM analysis_results WHERE meeting_id = ? AND result_type = ?',
-                    (meeting_id, result_type)
-                )
-            else:
-                cursor.execute(
-                    'SELECT * FROM analysis_results WHERE meeting_id = ?',
-                    (meeting_id,)
-                )
+        return list(self.iter_analysis_results(meeting_id, result_type))
+    
+    def iter_analysis_results(self, meeting_id: int, result_type: str = None):
+        """Iterate over the analysis results for a meeting.
+        
+        Rows are read in batches of READ_BATCH_SIZE and parsed as the caller
+        consumes them, and no connection is held between batches, so the full
+        result is never held in memory at once and stopping early is safe.
+        
+        Args:
+            meeting_id: Meeting ID
+            result_type: Type of analysis result (optional)
             
-            rows = cursor.fetchall()
-            self._close_connection(conn)
+        Yields:
+            AnalysisResult rows
+        """
+        if result_type:
+            sql = (
+                f'SELECT {_ANALYSIS_RESULT_COLUMNS} FROM analysis_results '
+                'WHERE meeting_id = ? AND result_type = ? AND id > ? ORDER BY id LIMIT ?'
+            )
+            params = (meeting_id, result_type)
+        else:
+            sql = (
+                f'SELECT {_ANALYSIS_RESULT_COLUMNS} FROM analysis_results '
+                'WHERE meeting_id = ? AND id > ? ORDER BY id LIMIT ?'
+            )
+            params = (meeting_id,)
+        
+        last_id = 0
+        while True:
+            with self._conn(readonly=True) as conn:
+                rows = conn.execute(sql, params + (last_id, READ_BATCH_SIZE)).fetchall()
             
-            results = []
-            for row in rows:
-                result = dict(row)
+            for result_id, result_meeting_id, row_type, result_data, created_at in rows:
                 # Parse the JSON data
-                if result['result_data']:
-                    result['result_data'] = json.loads(result['result_data'])
-                results.append(result)
+                if result_data:
+                    result_data = _load_json(result_data)
+                yield AnalysisResult(result_id, result_meeting_id, row_type, result_data, created_at)
+            if len(rows) < READ_BATCH_SIZE:
+                return
+            last_id = rows[-1][0]
+    
+    def get_analysis_field(self, meeting_id: int, result_type: str, json_path: str) -> Any:
+        """Get a single field of a meeting's latest analysis result of a type.
+        
+        The field is extracted by SQLite, so the rest of the result data is
+        never parsed.
+        
+        Args:
+            meeting_id: Meeting ID
+            result_type: Type of analysis result
+            json_path: SQLite JSON path of the field, e.g. '$.summary.top_emotions[0][0]'
+            
+        Returns:
+            The field value, with objects and arrays as JSON text, or None if
+            there is no such result or field
+        """
+        def get_analysis_field_operation():
+            with self._conn(readonly=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    SELECT json_extract(result_data, ?) FROM analysis_results
+                    WHERE meeting_id = ? AND result_type = ?
+                    ORDER BY id DESC LIMIT 1
+                ''', (json_path, meeting_id, result_type))
+                row = cursor.fetchone()
             
-            return results
+            return row[0] if row else None
             
-        return self._execute_with_retry(get_analysis_results_operation)
+        return self._execute_with_retry(get_analysis_field_operation)
 
 
 def test_database_manager():
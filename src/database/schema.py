@@ -74,6 +74,8 @@ def create_database_schema(db_path=None):
             end_time TIMESTAMP,
             actual_start_time TIMESTAMP,
             actual_end_time TIMESTAMP,
+            candidate_name TEXT,
+            position TEXT,
             status TEXT,
             bot_id TEXT,
             recording_path TEXT,
@@ -111,22 +113,23 @@ def create_database_schema(db_path=None):
         )
         ''')
         
-        # Create triggers to update the updated_at timestamp
+        # Create triggers to update the updated_at timestamp when an update does
+        # not set it, in the local ISO format that DatabaseManager writes
         cursor.execute('''
         CREATE TRIGGER IF NOT EXISTS update_users_timestamp
         AFTER UPDATE ON users
-        FOR EACH ROW
+        FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
         BEGIN
-            UPDATE users SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
+            UPDATE users SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime') WHERE id = OLD.id;
         END;
         ''')
         
         cursor.execute('''
         CREATE TRIGGER IF NOT EXISTS update_meetings_timestamp
         AFTER UPDATE ON meetings
-        FOR EACH ROW
+        FOR EACH ROW WHEN NEW.updated_at IS OLD.updated_at
         BEGIN
-            UPDATE meetings SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
+            UPDATE meetings SET updated_at = strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime') WHERE id = OLD.id;
         END;
         ''')
         
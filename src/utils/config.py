@@ -37,6 +37,9 @@ class Config(BaseModel):
     
     # Hume AI Configuration
     hume_api_key: Optional[str] = None
+    hume_job_timeout: int = 300  # Seconds to wait for a Hume job to complete
+    keep_raw_csv: bool = False  # Embed the raw Hume CSV rows in hume_analysis.json
+    persist_artifacts: bool = False  # Extract the Hume artifact CSVs next to the ZIP file
     
     # Anthropic API Configuration
     anthropic_api_key: Optional[str] = None
@@ -89,6 +92,9 @@ class Config(BaseModel):
             
             # Hume AI Configuration
             "hume_api_key": os.getenv("HUME_API_KEY"),
+            "hume_job_timeout": int(os.getenv("HUME_JOB_TIMEOUT", "300")),
+            "keep_raw_csv": os.getenv("KEEP_RAW_CSV", "False").lower() == "true",
+            "persist_artifacts": os.getenv("PERSIST_ARTIFACTS", "False").lower() == "true",
             
             # Anthropic API Configuration
             "anthropic_api_key": os.getenv("ANTHROPIC_API_KEY"),
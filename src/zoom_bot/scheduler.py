@@ -83,16 +83,15 @@ class ZoomBotScheduler:
         """Load scheduled meetings from the database."""
         try:
             # Get all meetings with status 'scheduled'
-            conn = self.db_manager._get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT id, url, scheduled_time FROM meetings
-                WHERE status = 'scheduled'
-            ''')
-            
-            scheduled_meetings = cursor.fetchall()
-            conn.close()
+            with self.db_manager._conn(readonly=True) as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, url, scheduled_time FROM meetings
+                    WHERE status = 'scheduled'
+                ''')
+                
+                scheduled_meetings = cursor.fetchall()
             
             for meeting_id, url, scheduled_time in scheduled_meetings:
                 if scheduled_time:
@@ -305,11 +304,10 @@ def test_scheduler():
         )
         
         # Get the user's hash key
-        conn = db_manager._get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT hash_key FROM users WHERE id = ?', (user_id,))
-        user_hash_key = cursor.fetchone()[0]
-        conn.close()
+        with db_manager._conn(readonly=True) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT hash_key FROM users WHERE id = ?', (user_id,))
+            user_hash_key = cursor.fetchone()[0]
         
         # Add a test meeting scheduled for 1 minute from now
         meeting_time = datetime.now() + timedelta(minutes=1)
@@ -0,0 +1,161 @@
+"""
+Tests for the pooled connections and transactions of DatabaseManager.
+"""
+
+import threading
+
+import pytest
+
+from src.database import manager
+from src.database.manager import DatabaseManager
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """A database manager for a fresh database file."""
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+    DatabaseManager._instances.pop(manager.db_path, None)
+
+
+def _add_meeting(db_manager):
+    """Add a user and a meeting, returning the meeting ID."""
+    user_id = db_manager.add_user(email="interviewer@example.com")
+    user_hash_key = db_manager.get_user(user_id=user_id)["hash_key"]
+    return db_manager.add_meeting(user_hash_key, "https://zoom.us/j/1234567890")
+
+
+def test_same_instance_per_database_file(db_manager, tmp_path, monkeypatch):
+    assert DatabaseManager(str(tmp_path / "test.db")) is db_manager
+
+    # Paths are compared once resolved
+    monkeypatch.chdir(tmp_path)
+    assert DatabaseManager("test.db") is db_manager
+    assert DatabaseManager(str(tmp_path / "sub" / ".." / "test.db")) is db_manager
+
+
+def test_separate_instances_per_database_file(db_manager, tmp_path):
+    other_path = str(tmp_path / "other.db")
+    other = DatabaseManager(other_path)
+    try:
+        assert other is not db_manager
+        assert other.db_path == other_path
+
+        # Each instance writes to its own database
+        db_manager.add_user(email="only.here@example.com")
+        assert other.get_users_by_email("only.here@example.com") == []
+    finally:
+        other.close()
+        DatabaseManager._instances.pop(other_path, None)
+
+
+def test_reads_see_writes_committed_on_other_threads(db_manager):
+    # Warm up the read pool so later reads reuse pooled connections
+    assert db_manager.get_users_by_email("user0@example.com") == []
+
+    errors = []
+
+    def add_and_read(i):
+        try:
+            email = f"user{i}@example.com"
+            db_manager.add_user(email=email)
+            assert len(db_manager.get_users_by_email(email)) == 1
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=add_and_read, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    for i in range(8):
+        assert len(db_manager.get_users_by_email(f"user{i}@example.com")) == 1
+
+
+def test_transaction_commits_on_success(db_manager):
+    with db_manager.transaction():
+        db_manager.add_user(email="first@example.com")
+        db_manager.add_user(email="second@example.com")
+
+    assert len(db_manager.get_users_by_email("first@example.com")) == 1
+    assert len(db_manager.get_users_by_email("second@example.com")) == 1
+
+
+def test_transaction_rolls_back_on_error(db_manager):
+    with pytest.raises(ValueError):
+        with db_manager.transaction():
+            db_manager.add_user(email="rolled.back@example.com")
+            raise ValueError("abort")
+
+    assert db_manager.get_users_by_email("rolled.back@example.com") == []
+
+    # The database stays usable after the rollback
+    db_manager.add_user(email="after@example.com")
+    assert len(db_manager.get_users_by_email("after@example.com")) == 1
+
+
+def test_get_connection_is_separate_from_open_transaction(db_manager):
+    with db_manager.transaction():
+        connection = db_manager._get_connection()
+        connection.close()
+        db_manager.add_user(email="inside@example.com")
+
+    assert len(db_manager.get_users_by_email("inside@example.com")) == 1
+
+
+def test_add_analysis_results_returns_ids_in_item_order(db_manager):
+    meeting_id = _add_meeting(db_manager)
+    db_manager.add_analysis_result(meeting_id, "summary", {"score": 0})
+
+    items = [("hume", {"index": 1}), ("insights", {"index": 2}), ("report", {"index": 3})]
+    result_ids = db_manager.add_analysis_results(meeting_id, items)
+
+    assert len(result_ids) == len(items)
+    assert result_ids == sorted(result_ids)
+    results = {result.id: result for result in db_manager.get_analysis_results(meeting_id)}
+    for result_id, (result_type, result_data) in zip(result_ids, items):
+        assert results[result_id].result_type == result_type
+        assert results[result_id].result_data == result_data
+
+
+def test_add_analysis_results_inside_transaction(db_manager):
+    meeting_id = _add_meeting(db_manager)
+
+    with db_manager.transaction():
+        result_ids = db_manager.add_analysis_results(meeting_id, [("a", {}), ("b", {})])
+
+    results = db_manager.get_analysis_results(meeting_id)
+    assert [result.id for result in results] == result_ids
+    assert [result.result_type for result in results] == ["a", "b"]
+
+
+def test_iterators_read_in_batches_without_holding_a_connection(db_manager, monkeypatch):
+    monkeypatch.setattr(manager, "READ_BATCH_SIZE", 2)
+    meeting_id = _add_meeting(db_manager)
+    result_ids = db_manager.add_analysis_results(meeting_id, [("a", {"index": i}) for i in range(5)])
+
+    assert [result.id for result in db_manager.iter_analysis_results(meeting_id)] == result_ids
+
+    # A suspended iterator leaves no connection checked out, so writes go through
+    results = db_manager.iter_analysis_results(meeting_id)
+    next(results)
+    writer = threading.Thread(target=db_manager.add_user, kwargs={"email": "writer@example.com"})
+    writer.start()
+    writer.join(timeout=5)
+    assert not writer.is_alive()
+    assert [result.id for result in results] == result_ids[1:]
+
+
+def test_in_memory_database():
+    db_manager = DatabaseManager(":memory:")
+    try:
+        with db_manager.transaction():
+            meeting_id = _add_meeting(db_manager)
+
+        assert db_manager.get_meeting(meeting_id)["url"] == "https://zoom.us/j/1234567890"
+    finally:
+        db_manager.close()
+        DatabaseManager._instances.pop(":memory:", None)